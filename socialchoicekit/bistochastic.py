@@ -18,8 +18,31 @@ def birkhoff_von_neumann(X: np.ndarray) -> List[Tuple[float, np.ndarray]]:
   List[Tuple[int, np.ndarray]]
     A list of tuples of the form (coefficient, permutation matrix).
   """
+  n = X.shape[0]
+  result = []
+  for (z, permutation) in birkhoff_von_neumann_index_vectors(X):
+    P = np.zeros((n, n))
+    P[np.arange(n), permutation] = 1
+    result.append((z, P))
+  return result
+
+def birkhoff_von_neumann_index_vectors(X: np.ndarray) -> List[Tuple[float, np.ndarray]]:
+  """
+  The Birkhoff-von-Neumann algorithm, returning each permutation matrix as a permutation index vector instead of a dense matrix.
+
+  Parameters
+  ----------
+  X : np.ndarray
+    A bistochastic matrix.
+
+  Returns
+  -------
+  List[Tuple[float, np.ndarray]]
+    A list of tuples of the form (coefficient, permutation index vector). The element at i of a permutation index vector is the column matched to row i, so the dense permutation matrix would have a 1 at (i, vector[i]). This representation avoids materializing and rescanning dense n x n matrices.
+  """
   check_square_matrix(X)
   n = X.shape[0]
+  rows = np.arange(n)
 
   result = []
   while True:
@@ -29,13 +52,12 @@ def birkhoff_von_neumann(X: np.ndarray) -> List[Tuple[float, np.ndarray]]:
     G_X = positivity_graph(X)
     # Positivty graphs always have an 2n vertices.
     perfect_matching = maximum_cardinality_matching_bipartite(G_X, list(range(n)), list(range(n, n * 2)))
-    P = np.zeros(X.shape)
-    z = np.inf
+    permutation = np.zeros(n, dtype=int)
     for (i, j) in perfect_matching:
-      P[i, j - n] = 1
-      z = min(z, X[i, j - n])
-    X -= z * P
-    result.append((z, P))
+      permutation[i] = j - n
+    z = np.amin(X[rows, permutation])
+    X[rows, permutation] -= z
+    result.append((z, permutation))
   return result
 
 def positivity_graph(X: np.ndarray) -> Dict[int, List[int]]:
@@ -325,23 +325,17 @@ class Irving:
     preference_lists_2 = {j: ranked_profile_2[j, :profile_2[j, i] + 1] for i, j in stable_marriage}
 
     # We then reduce the shortlist to enforce the first statement of Property 2.
-    # This is O(n^3) using a naive approach.
+    # Membership sets make each containment check O(1) instead of an O(n) array scan,
+    # and np.fromiter builds each reduced list in one pass instead of one np.append copy per element,
+    # so the reduction is O(n^2) overall.
+    members_2 = {j: set(preference_lists_2[j].tolist()) for j in range(n)}
     new_preference_lists_1 = {}
-    new_preference_lists_2 = {}
     for i in range(n):
-      new_preference_lists_1[i] = np.array([])
-      for j in preference_lists_1[i]:
-        if i in preference_lists_2[j]:
-          new_preference_lists_1[i] = np.append(new_preference_lists_1[i], j)
+      new_preference_lists_1[i] = np.fromiter((j for j in preference_lists_1[i] if i in members_2[j]), dtype=np.int64)
+    members_1 = {i: set(new_preference_lists_1[i].tolist()) for i in range(n)}
+    new_preference_lists_2 = {}
     for j in range(n):
-      new_preference_lists_2[j] = np.array([])
-      for i in preference_lists_2[j]:
-        if j in new_preference_lists_1[i]:
-          new_preference_lists_2[j] = np.append(new_preference_lists_2[j], i)
-
-    for i in range(n):
-      new_preference_lists_1[i] = new_preference_lists_1[i].astype(np.int64)
-      new_preference_lists_2[i] = new_preference_lists_2[i].astype(np.int64)
+      new_preference_lists_2[j] = np.fromiter((i for i in preference_lists_2[j] if j in members_1[i]), dtype=np.int64)
     return new_preference_lists_1, new_preference_lists_2
 
   def find_all_rotations_and_eliminations(
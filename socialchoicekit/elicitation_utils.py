@@ -28,6 +28,14 @@ class Elicitor:
       self.memoized_values = {}
     self.index_fixer = 0 if zero_indexed else 1
 
+  def reset(self) -> None:
+    """
+    Clears the memoized values and resets the elicitation count, so the same elicitor instance can be reused for a fresh run without being reconstructed.
+    """
+    self.elicitation_count = 0
+    if self.memoize:
+      self.memoized_values.clear()
+
   def elicit(
     self,
     agent: int,
@@ -211,6 +219,52 @@ class ValuationProfileElicitor(Elicitor):
     self.valuation_profile = valuation_profile
     super().__init__(memoize=memoize, zero_indexed=True)
 
+  def elicit_multiple(
+      self,
+      agents: np.ndarray,
+      alternatives: np.ndarray,
+  ) -> np.ndarray:
+    """
+    Given an agents array and an alternative array both of size N, returns an array of size N containing the elicited values.
+    (The ith agent is elicited about the ith alternative.)
+
+    Overrides the base implementation: because the valuation profile is fully pre-populated, all values are fetched with one fancy-indexed lookup instead of N scalar elicit calls.
+
+    Parameters
+    ----------
+    agents: np.ndarray
+      The agents array. Must contain only integers that correspond to a valid agent.
+
+    alternatives: np.ndarray
+      The alternatives array. Must contain only integers that correspond to a valid alternative.
+
+    Returns
+    -------
+    np.ndarray
+      The elicited values. Size is the same as the size of the two input arrays.
+    """
+    if agents.shape != alternatives.shape:
+      raise ValueError("The two input arrays must have the same shape.")
+
+    if not (np.issubdtype(agents.dtype, np.integer) and np.issubdtype(alternatives.dtype, np.integer)):
+      raise ValueError("The input arrays must contain only integers.")
+
+    # This elicitor is always zero-indexed, so the indices can be used directly.
+    values = np.asarray(self.valuation_profile)[agents, alternatives]
+    if self.memoize:
+      # Preserve the scalar semantics: only pairs not seen before count as elicitations,
+      # and duplicates within one batch are elicited once.
+      for position, pair in enumerate(zip(agents.tolist(), alternatives.tolist())):
+        memoized_value = self.memoized_values.get(pair)
+        if memoized_value is None:
+          self.elicitation_count += 1
+          self.memoized_values[pair] = values[position]
+        else:
+          values[position] = memoized_value
+    else:
+      self.elicitation_count += int(agents.size)
+    return values
+
   def _elicit_impl(
     self,
     agent: int,
@@ -238,6 +292,57 @@ class IntegerValuationProfileElicitor(IntegerElicitor):
     self.valuation_profile = valuation_profile
     super().__init__(memoize=memoize, zero_indexed=True)
 
+  def elicit_multiple(
+      self,
+      agents: np.ndarray,
+      alternatives: np.ndarray,
+  ) -> np.ndarray:
+    """
+    Given an agents array and an alternative array both of size N, returns an array of size N containing the elicited values.
+    (The ith agent is elicited about the ith alternative.)
+
+    Overrides the base implementation: because the valuation profile is fully pre-populated, all values are fetched with one fancy-indexed lookup instead of N scalar elicit calls.
+
+    Parameters
+    ----------
+    agents: np.ndarray
+      The agents array. Must contain only integers that correspond to a valid agent.
+
+    alternatives: np.ndarray
+      The alternatives array. Must contain only integers that correspond to a valid alternative.
+
+    Returns
+    -------
+    np.ndarray
+      The elicited values. Size is the same as the size of the two input arrays.
+      The array is of integer type.
+    """
+    if agents.shape != alternatives.shape:
+      raise ValueError("The two input arrays must have the same shape.")
+
+    if not (np.issubdtype(agents.dtype, np.integer) and np.issubdtype(alternatives.dtype, np.integer)):
+      raise ValueError("The input arrays must contain only integers.")
+
+    # This elicitor is always zero-indexed, so the indices can be used directly.
+    values = np.asarray(self.valuation_profile)[agents, alternatives]
+    # The constructor does not enforce that the profile is integer-valued, so match the scalar elicit semantics before casting.
+    if not np.issubdtype(values.dtype, np.integer) and not np.all(values == np.floor(values)):
+      raise ValueError("The elicited value must be an integer.")
+    values = values.astype(int, copy=False)
+    if self.memoize:
+      # Preserve the scalar semantics: only pairs not seen before count as elicitations,
+      # and duplicates within one batch are elicited once.
+      for position, pair in enumerate(zip(agents.tolist(), alternatives.tolist())):
+        memoized_value = self.memoized_values.get(pair)
+        if memoized_value is None:
+          self.elicitation_count += 1
+          self.memoized_values[pair] = values[position]
+        else:
+          values[position] = memoized_value
+    else:
+      self.elicitation_count += int(agents.size)
+    return values
+
   def _elicit_impl(
     self,
     agent: int,
@@ -1,12 +1,179 @@
-import sys, copy
-from typing import Dict, List, Tuple, Union, Set
+import sys
+from collections import deque
+from typing import Dict, List, Tuple, Set
 import numpy as np
 
 from socialchoicekit.utils import check_bipartite_graph
 
+def _build_residual_csr(G: Dict[int, List[Tuple[int, int]]]) -> Tuple[List[int], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Tuple[int, int, int, int]]]:
+  """
+  Converts a dictionary-based flow network into paired residual edges in compressed sparse row (CSR) form.
+
+  Each original edge contributes a forward residual edge with the original capacity and a reverse residual edge with capacity 0, with rev mapping each edge to its pair. Operating on flat int arrays instead of dicts of tuples keeps the augmenting loop free of per-edge Python object allocation.
+
+  Returns
+  -------
+  Tuple[List[int], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Tuple[int, int, int, int]]]
+    The original vertex ids in index order, then the indptr, indices (edge heads), tail (edge tails), cap, and rev arrays, then one (u, v, forward edge index, capacity) record per original edge.
+  """
+  # Adjacency entries are either (vertex, capacity) tuples or bare vertices with an implicit capacity of 1 (the unit-capacity form convert_bipartite_graph_to_flow_network produces). Detect which once.
+  has_capacities = True
+  for adjacency in G.values():
+    if len(adjacency) > 0:
+      has_capacities = isinstance(adjacency[0], tuple)
+      break
+
+  def edges_of(u):
+    if has_capacities:
+      return G[u]
+    return [(v, 1) for v in G[u]]
+
+  node_ids = list(G.keys())
+  seen = set(node_ids)
+  for u in G.keys():
+    for (v, _) in edges_of(u):
+      if v not in seen:
+        seen.add(v)
+        node_ids.append(v)
+  index_of = {u: i for i, u in enumerate(node_ids)}
+  n = len(node_ids)
+
+  degree = np.zeros(n, dtype=np.int32)
+  for u in G.keys():
+    degree[index_of[u]] += len(G[u])
+    for (v, _) in edges_of(u):
+      degree[index_of[v]] += 1
+  indptr = np.zeros(n + 1, dtype=np.int32)
+  np.cumsum(degree, out=indptr[1:])
+
+  m = int(indptr[-1])
+  indices = np.zeros(m, dtype=np.int32)
+  tail = np.zeros(m, dtype=np.int32)
+  cap = np.zeros(m, dtype=np.int64)
+  rev = np.zeros(m, dtype=np.int32)
+  fill_position = indptr[:-1].astype(np.int64)
+  forward_edges = []
+  for u in G.keys():
+    u_index = index_of[u]
+    for (v, c) in edges_of(u):
+      v_index = index_of[v]
+      forward = int(fill_position[u_index])
+      fill_position[u_index] += 1
+      reverse = int(fill_position[v_index])
+      fill_position[v_index] += 1
+      indices[forward] = v_index
+      tail[forward] = u_index
+      cap[forward] = c
+      rev[forward] = reverse
+      indices[reverse] = u_index
+      tail[reverse] = v_index
+      cap[reverse] = 0
+      rev[reverse] = forward
+      forward_edges.append((u, v, forward, c))
+  return node_ids, indptr, indices, tail, cap, rev, forward_edges
+
+def _shortest_augmenting_path_csr(indptr: np.ndarray, indices: np.ndarray, tail: np.ndarray, cap: np.ndarray, rev: np.ndarray, s: int, t: int, parent_edge: np.ndarray) -> int:
+  """
+  Finds one shortest augmenting path with breadth first search and applies it to the residual capacities in place.
+
+  parent_edge is a preallocated int32 scratch array reused across calls: -1 marks an unvisited vertex, -2 the source, and any other value the residual edge used to reach the vertex.
+
+  Returns
+  -------
+  int
+    The bottleneck capacity of the augmenting path, or 0 if the sink is unreachable.
+  """
+  parent_edge.fill(-1)
+  parent_edge[s] = -2
+  queue = deque([s])
+  while queue:
+    u = queue.popleft()
+    for k in range(indptr[u], indptr[u + 1]):
+      if cap[k] > 0:
+        v = indices[k]
+        if parent_edge[v] == -1:
+          parent_edge[v] = k
+          if v == t:
+            # Walk back to the source to find the bottleneck, then apply it.
+            bottleneck = sys.maxsize
+            w = t
+            while parent_edge[w] != -2:
+              k = parent_edge[w]
+              bottleneck = min(bottleneck, int(cap[k]))
+              w = tail[k]
+            w = t
+            while parent_edge[w] != -2:
+              k = parent_edge[w]
+              cap[k] -= bottleneck
+              cap[rev[k]] += bottleneck
+              w = tail[k]
+            return bottleneck
+          queue.append(v)
+  return 0
+
+def _dinic_phase_csr(indptr: np.ndarray, indices: np.ndarray, tail: np.ndarray, cap: np.ndarray, rev: np.ndarray, s: int, t: int, level: np.ndarray, edge_position: np.ndarray) -> int:
+  """
+  Runs one phase of Dinic's algorithm on the CSR residual arrays: a BFS assigning levels, then a blocking flow found by iterative DFS restricted to level-increasing edges.
+
+  level and edge_position are preallocated scratch arrays reused across phases. On unit-capacity networks the number of phases is O(sqrt(E)), which is why ford_fulkerson dispatches here for them.
+
+  Returns
+  -------
+  int
+    The flow pushed during this phase, or 0 if the sink is no longer reachable.
+  """
+  level.fill(-1)
+  level[s] = 0
+  queue = deque([s])
+  while queue:
+    u = queue.popleft()
+    for k in range(indptr[u], indptr[u + 1]):
+      if cap[k] > 0 and level[indices[k]] == -1:
+        level[indices[k]] = level[u] + 1
+        queue.append(indices[k])
+  if level[t] == -1:
+    return 0
+
+  np.copyto(edge_position, indptr[:-1])
+  pushed_total = 0
+  path = []
+  u = s
+  while True:
+    if u == t:
+      bottleneck = min(int(cap[k]) for k in path)
+      for k in path:
+        cap[k] -= bottleneck
+        cap[rev[k]] += bottleneck
+      pushed_total += bottleneck
+      # Retreat to the tail of the first saturated edge and keep extending from there.
+      cut = next(i for i, k in enumerate(path) if cap[k] == 0)
+      u = tail[path[cut]]
+      del path[cut:]
+      continue
+    advanced = False
+    while edge_position[u] < indptr[u + 1]:
+      k = int(edge_position[u])
+      v = indices[k]
+      if cap[k] > 0 and level[v] == level[u] + 1:
+        path.append(k)
+        u = v
+        advanced = True
+        break
+      edge_position[u] += 1
+    if not advanced:
+      if u == s:
+        return pushed_total
+      # Dead end: no level-increasing edge left, so remove the vertex from the level graph.
+      level[u] = -1
+      k = path.pop()
+      u = tail[k]
+      edge_position[u] += 1
+
 def ford_fulkerson(G: Dict[int, List[Tuple[int, int]]], s: int, t: int) -> Tuple[Dict[Tuple[int, int], int], Set[int]]:
   """
-  The Ford Fulkerson algorithm for computing the maximum flow and minimum cut in a flow network (with depth first search)
+  The Ford Fulkerson algorithm for computing the maximum flow and minimum cut in a flow network.
+
+  Augmenting paths are found with breadth first search (the Edmonds-Karp rule), which bounds the number of augmentations by O(V * E) independent of the capacity values. Networks whose capacities are all 1 - which includes every network produced by convert_bipartite_graph_to_flow_network - are detected at entry and solved with Dinic's blocking flows instead, in O(E * sqrt(E)). The residual graph is held in flat CSR arrays built once up front, so the inner loop only reads and writes int arrays and the scratch buffers are reused across augmentations.
 
   This implementation only works with integral capacities, and we use this to ensure that the algorithm terminates.
 
@@ -15,6 +182,7 @@ def ford_fulkerson(G: Dict[int, List[Tuple[int, int]]], s: int, t: int) -> Tuple
   G : Dict[int, List[Tuple[int, int]]]
     A flow network of the form {i: [(j, c), (k, c), ...]} where i is the index of a vertex and [(j, c), (k, c), ...] are the indices of the vertices that i is connected to along with the capacity of the edge.
     The value of the capacities cannot exceed sys.maxsize.
+    The unit-capacity form {i: [j, k, ...]} produced by convert_bipartite_graph_to_flow_network, where every edge has an implicit capacity of 1, is also accepted.
   s : int
     The index of the source vertex.
   t : int
@@ -30,91 +198,47 @@ def ford_fulkerson(G: Dict[int, List[Tuple[int, int]]], s: int, t: int) -> Tuple
   Set[int]
     A subset of the nodes that are in the source side of the minimum cut.
   """
-  # Residual graph
-  G_f = copy.deepcopy(G)
+  node_ids, indptr, indices, tail, cap, rev, forward_edges = _build_residual_csr(G)
+  index_of = {u: i for i, u in enumerate(node_ids)}
+  s_index = index_of[s]
+  t_index = index_of[t]
+  n = len(node_ids)
+  # Once the source's outgoing capacity is exhausted no augmenting path can exist, so tracking it saves the final full-graph search that would only fail.
+  remaining_source_capacity = int(cap[indptr[s_index]:indptr[s_index + 1]].sum())
+
+  if all(c == 1 for (_, _, _, c) in forward_edges):
+    # Unit-capacity networks (every bipartite-derived network here) finish in O(E * sqrt(E)) with Dinic's blocking flows.
+    level = np.empty(n, dtype=np.int32)
+    edge_position = np.empty(n, dtype=np.int64)
+    while remaining_source_capacity > 0:
+      pushed = _dinic_phase_csr(indptr, indices, tail, cap, rev, s_index, t_index, level, edge_position)
+      if pushed == 0:
+        break
+      remaining_source_capacity -= pushed
+  else:
+    parent_edge = np.zeros(n, dtype=np.int32)
+    while remaining_source_capacity > 0:
+      bottleneck = _shortest_augmenting_path_csr(indptr, indices, tail, cap, rev, s_index, t_index, parent_edge)
+      if bottleneck == 0:
+        break
+      remaining_source_capacity -= bottleneck
+
+  # Only return the flow in the original graph. The flow on each original edge is its capacity minus its residual capacity.
   flow = dict()
-
-  for i in G.keys():
-    for j, _ in G[i]:
-      flow[(i, j)] = 0
-      flow[(j, i)] = 0
-      if all([v != i for (v, _) in G_f[j]]):
-        # Add the reverse edge if it does not exist in the residual graph.
-        G_f[j] += [(i, 0)]
-
-  while True:
-    path_from_sink_to_source = dfs_path(G_f, s, t, {i: 0 for i in G_f.keys()})
-    if path_from_sink_to_source is None:
-      # Only return the flow in the original graph
-      flow_final = dict()
-      for i in G.keys():
-        for j, _ in G[i]:
-          flow_final[(i, j)] = flow[(i, j)]
-      return flow_final, reachable_vertices(G_f, s)
-
-    path, c_f_p = path_from_sink_to_source
-    for i in range(len(path) - 1):
-      u = path[i]
-      v = path[i + 1]
-      flow[(u, v)] += c_f_p
-      flow[(v, u)] -= c_f_p
-      # Here, the flow network is only updated for the original network.
-      # The residual network in addition gets a flow from v to u with capacity addition of -c_f_p.
-      # Update c_f, the capacities of the residual graph. c_f = c - f
-      # In effect, this changes by +- c_f_p
-      G_f[u] = [(w, c_f - c_f_p) if w == v else (w, c_f) for (w, c_f) in G_f[u]]
-      G_f[v] = [(w, c_f + c_f_p) if w == u else (w, c_f) for (w, c_f) in G_f[v]]
-
-def dfs_path(G: Dict[int, List[Tuple[int, int]]], current: int, sink: int, visited: Dict[int, int]) -> Union[Tuple[List[int], int], None]:
-  """
-  Finds a path from the given vertex to the sink vertex.
-
-  Parameters
-  ----------
-  G : Dict[int, List[Tuple[int, int]]]
-    A flow network of the form {i: [(j, c), (k, c), ...]} where i is the index of a vertex and [(j, c), (k, c), ...] are the indices of the vertices that i is connected to along with the capacity of the edge.
-    The value of the capacities cannot exceed sys.maxsize.
-
-  current : int
-    The index of the current vertex.
-
-  sink : int
-    The index of the sink vertex.
-
-  visited : Dict[int, int]
-    A dictionary of the form {i: j} where i is the index of a vertex and j is 0 if i is not visited, 1 if i is visited.
-
-  Returns
-  -------
-  Tuple[List[int], int]
-    A tuple of the form (path, capacity) where path is a list of vertices in the path from the current vertex to the sink vertex and capacity is the capacity of the path.
-
-  None
-    If there is no path from the current vertex to the sink vertex.
-  """
-  if current == sink:
-    # Undo visit so other path searches could visit
-    visited[current] = 0
-    return ([current], sys.maxsize)
-  candidates = G[current]
-  best_path = None
-  best_capacity = 0
-  for (v, c) in candidates:
-    if visited[v] != 0:
-      continue
-    if c > 0:
-      visited[v] = 1
-      subpath = dfs_path(G, v, sink, visited)
-      if subpath is not None:
-        path, capacity = subpath
-        # As a heuristic, return the path with the best capacity.
-        if min(capacity, c) > best_capacity:
-          best_path = [current] + path
-          best_capacity = min(capacity, c)
-  if best_path is not None:
-    visited[current] = 0
-    return (best_path, best_capacity)
-  return None
+  for (u, v, forward, c) in forward_edges:
+    flow[(u, v)] = flow.get((u, v), 0) + c - int(cap[forward])
+
+  # The source side of the minimum cut is whatever is still reachable in the residual graph.
+  min_cut = set()
+  frontier = deque([s_index])
+  while frontier:
+    u = frontier.popleft()
+    if node_ids[u] not in min_cut:
+      min_cut.add(node_ids[u])
+      for k in range(indptr[u], indptr[u + 1]):
+        if cap[k] > 0 and node_ids[indices[k]] not in min_cut:
+          frontier.append(indices[k])
+  return flow, min_cut
 
 def reachable_vertices(G: Dict[int, List[Tuple[int, int]]], s: int) -> Set[int]:
   """
@@ -202,13 +326,14 @@ def capacity_across_cut(G: Dict[int, List[Tuple[int, int]]], cut: Set[int]) -> i
         ans -= c
   return ans
 
-def convert_bipartite_graph_to_flow_network(G: Dict[int, List[int]], X: list, Y: list) -> Dict[int, List[Tuple[int, int]]]:
+def convert_bipartite_graph_to_flow_network(G: Dict[int, List[int]], X: list, Y: list) -> Dict[int, Tuple[int, ...]]:
   """
-  Converts a bipartite graph to a flow network by performing the following.
+  Converts a bipartite graph to a unit-capacity flow network by performing the following.
   - Add a source vertex s and a sink vertex t. In this implementation, s = -1, t = -2.
   - Add an edge from s to each vertex in X.
   - Add an edge from each vertex in Y to t.
-  - For each edge in the unweighted graph, assign capacity 1 to each edge.
+
+  Every edge has capacity 1, so the capacity is left implicit: adjacency lists hold bare vertex ids rather than (vertex, capacity) tuples, which halves the allocations per edge. ford_fulkerson accepts this form directly.
 
   Must run utils.convert_bipartite_graph on G, X, Y before calling this function.
 
@@ -226,26 +351,174 @@ def convert_bipartite_graph_to_flow_network(G: Dict[int, List[int]], X: list, Y:
 
   Returns
   -------
-  Dict[int, List[Tuple[int, int]]
-    A graph of the form {i: [(j, c), (k, c), ...]} where i is the index of a vertex and [(j, c), (k, c), ...] are the indices of the vertices that i is connected to along with the capacity of the edge.
+  Dict[int, Tuple[int, ...]]
+    A graph of the form {i: (j, k, ...)} where i is the index of a vertex and (j, k, ...) are the indices of the vertices that i is connected to, each edge having an implicit capacity of 1.
+    The adjacency is returned as tuples: downstream code only reads the network, and tuples are smaller and faster to iterate than lists.
   """
   # This is a shallow copy
   network = dict()
 
   for v in X:
-    network[v] = [(y, 1) for y in G.get(v, [])]
-  network[-1] = [(x, 1) for x in X]
-  network[-2] = []
+    network[v] = tuple(G.get(v, ()))
+  network[-1] = tuple(X)
+  network[-2] = ()
 
   # Remove all edges that originate from Y, as we assume edges are directed from X to Y.
   # Add edges from Y to sink.
   for v in Y:
-    network[v] = [(-2, 1)]
+    network[v] = (-2,)
   return network
 
+def convert_bipartite_graph_to_flow_network_csr(G: Dict[int, List[int]], X: list, Y: list) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+  """
+  Converts a bipartite graph to a unit-capacity flow network in compressed sparse row (CSR) form.
+
+  This is the array-based counterpart of convert_bipartite_graph_to_flow_network. Vertices are renumbered so that all ids are nonnegative: vertex 0 is the source, vertices 1 to |X| are the vertices of X in order, vertices |X| + 1 to |X| + |Y| are the vertices of Y in order, and vertex n - 1 is the sink. The adjacency of vertex u is indices[indptr[u]:indptr[u + 1]], with capacities in the matching slice of cap. Flat integer arrays avoid the per-edge tuple and list allocations of the dictionary form.
+
+  Must run utils.check_bipartite_graph on G, X, Y before calling this function.
+
+  Parameters
+  ----------
+  G : Dict[int, List[int]]
+    A bipartite graph of the form {i: [j, k, ...]} where i is the index of a vertex and [j, k, ...] are the indices of the vertices that i is connected to.
+    The graph may be undirected (as in for every edges from x to y there is an edge from y to x) or directed. If it is directed, then the edges are assumed to be directed from X to Y.
+
+  X : list
+    The list of the left vertices (in the first partition) in the bipartite graph G.
+
+  Y : list
+    The list of the right vertices (in the second partition) in the bipartite graph G.
+
+  Returns
+  -------
+  Tuple[np.ndarray, np.ndarray, np.ndarray, int]
+    For each component, see below.
+  np.ndarray
+    indptr: an int32 array of shape (n + 1,) where the edges leaving vertex u occupy positions indptr[u] to indptr[u + 1].
+  np.ndarray
+    indices: an int32 array holding the head vertex of each edge.
+  np.ndarray
+    cap: an int32 array holding the capacity of each edge (always 1 here).
+  int
+    n: the number of vertices, including the source and the sink.
+  """
+  num_x = len(X)
+  num_y = len(Y)
+  n = num_x + num_y + 2
+  y_index = {y: num_x + 1 + j for j, y in enumerate(Y)}
+
+  degree = np.zeros(n, dtype=np.int32)
+  degree[0] = num_x
+  for i, x in enumerate(X):
+    degree[i + 1] = len(G.get(x, []))
+  degree[num_x + 1:n - 1] = 1
+
+  indptr = np.zeros(n + 1, dtype=np.int32)
+  np.cumsum(degree, out=indptr[1:])
+  indices = np.zeros(int(indptr[-1]), dtype=np.int32)
+  cap = np.ones(int(indptr[-1]), dtype=np.int32)
+
+  indices[0:num_x] = np.arange(1, num_x + 1, dtype=np.int32)
+  for i, x in enumerate(X):
+    start = indptr[i + 1]
+    for k, y in enumerate(G.get(x, [])):
+      indices[start + k] = y_index[y]
+  indices[indptr[num_x + 1]:indptr[n - 1]] = n - 1
+  return indptr, indices, cap, n
+
+def hopcroft_karp(G: Dict[int, List[int]], X: list, Y: list) -> List[Tuple[int, int]]:
+  """
+  The Hopcroft-Karp algorithm for computing a maximum cardinality matching on a bipartite graph.
+
+  Each phase runs one breadth first search to layer the graph by distance from the unmatched vertices in X, then augments along vertex-disjoint shortest paths found by depth first search. This takes O(E * sqrt(V)) time, compared to O(V * E) for augmenting one path at a time.
+
+  Parameters
+  ----------
+  G : Dict[int, List[int]]
+    A dictionary of the form {i: [j, k, ...]} where i is the index of a vertex and [j, k, ...] are the indices of the vertices that i is connected to.
+    This graph may be directed or undirected. If it is directed, then the edges are assumed to be directed from X to Y.
+    This graph must be bipartite.
+
+  X : list
+    The list of the left vertices (in the first partition) in the bipartite graph G.
+
+  Y : list
+    The list of the right vertices (in the second partition) in the bipartite graph G.
+
+  Returns
+  -------
+  List[Tuple[int, int]]
+    A list of tuples of the form (i, j) where i is a vertex in X and j is a vertex in Y. This represents the maximum cardinality matching.
+  """
+  match_x = {x: None for x in X}
+  match_y = {y: None for y in Y}
+  dist = {x: sys.maxsize for x in X}
+
+  def bfs() -> bool:
+    # Layer the vertices in X by shortest alternating-path distance from an unmatched vertex.
+    queue = deque()
+    for x in X:
+      if match_x[x] is None:
+        dist[x] = 0
+        queue.append(x)
+      else:
+        dist[x] = sys.maxsize
+    found_augmenting_path = False
+    while queue:
+      x = queue.popleft()
+      for y in G.get(x, []):
+        w = match_y[y]
+        if w is None:
+          found_augmenting_path = True
+        elif dist[w] == sys.maxsize:
+          dist[w] = dist[x] + 1
+          queue.append(w)
+    return found_augmenting_path
+
+  def dfs(root: int) -> bool:
+    # Augment along a shortest path by only following edges into the next layer.
+    # The search is iterative: stack[d] is an (x, next edge position) frame and
+    # path_y[d] the Y-vertex it reached, so deep paths cost no Python call
+    # frames and cannot hit the recursion limit.
+    stack = [(root, 0)]
+    path_y = []
+    while stack:
+      x, i = stack[-1]
+      adjacency = G.get(x, [])
+      advanced = False
+      while i < len(adjacency):
+        y = adjacency[i]
+        i += 1
+        w = match_y[y]
+        if w is None:
+          # Free Y-vertex found: flip the matching along the whole path.
+          path_y.append(y)
+          for (frame_x, _), frame_y in zip(stack, path_y):
+            match_x[frame_x] = frame_y
+            match_y[frame_y] = frame_x
+          return True
+        if dist[w] == dist[x] + 1:
+          stack[-1] = (x, i)
+          path_y.append(y)
+          stack.append((w, 0))
+          advanced = True
+          break
+      if not advanced:
+        dist[x] = sys.maxsize
+        stack.pop()
+        if path_y:
+          path_y.pop()
+    return False
+
+  while bfs():
+    for x in X:
+      if match_x[x] is None:
+        dfs(x)
+  return [(x, match_x[x]) for x in X if match_x[x] is not None]
+
 def maximum_cardinality_matching_bipartite(G: Dict[int, List[int]], X: list, Y: list) -> List[Tuple[int, int]]:
   """
-  The maximum cardinality matching on a bipartite graph. This runs the Ford Fulkerson algorithm (with depth first search).
+  The maximum cardinality matching on a bipartite graph. This runs the Hopcroft-Karp algorithm.
 
   Parameters
   ----------
@@ -266,13 +539,5 @@ def maximum_cardinality_matching_bipartite(G: Dict[int, List[int]], X: list, Y:
     A list of tuples of the form (i, j) where i is a vertex in X and j is a vertex in Y. This represents the maximum cardinality matching.
   """
   check_bipartite_graph(G, X, Y)
-  network = convert_bipartite_graph_to_flow_network(G, X, Y)
-  flow, _ = ford_fulkerson(network, -1, -2)
-
-  matchings = []
-  for x in X:
-    matched_y = G[x][np.argmax(np.array([flow[(x, y)] for y in G[x]]))]
-    if (flow[x, matched_y] == 1):
-      matchings.append((x, matched_y))
-  return matchings
+  return hopcroft_karp(G, X, Y)
 
@@ -1,3 +1,6 @@
+from itertools import chain
+from typing import Callable, Dict, Tuple
+
 import numpy as np
 
 from preflibtools.instances import OrdinalInstance, CategoricalInstance
@@ -5,6 +8,54 @@ from preflibtools.instances import OrdinalInstance, CategoricalInstance
 from socialchoicekit.utils import check_tie_breaker
 from socialchoicekit.profile_utils import *
 
+_CONVERSION_CACHE_MAXSIZE = 32
+_conversion_cache: Dict[Tuple[int, str], tuple] = {}
+
+def _cached_conversion(instance, key: str, convert: Callable[[], Profile]) -> Profile:
+  """
+  Memoizes a deterministic preflib conversion on the identity of the parsed instance.
+
+  The cache key includes id(instance), and the instance itself is stored in the entry so its id cannot be recycled while the entry is alive. A copy of the cached profile is returned so callers mutating their result do not corrupt the cache. Entries are evicted oldest-first once the cache holds _CONVERSION_CACHE_MAXSIZE profiles.
+  """
+  cache_key = (id(instance), key)
+  hit = _conversion_cache.get(cache_key)
+  if hit is None or hit[0] is not instance:
+    if len(_conversion_cache) >= _CONVERSION_CACHE_MAXSIZE:
+      _conversion_cache.pop(next(iter(_conversion_cache)))
+    _conversion_cache[cache_key] = (instance, convert())
+  return _conversion_cache[cache_key][1].copy()
+
+def _rank_tied_groups(preference: np.ndarray, order, tie_breaker: str) -> None:
+  """
+  Writes the ranks for one voter's tie groups into the preference row in a single pass.
+
+  The starting rank of each group is repeated over its members, and for "first" and "random" one lexsort over (tie key, group rank) orders the whole row at once - the tie key is the alternative id for "first" and one random draw for the row for "random" - replacing the per-group sort or shuffle calls.
+
+  Parameters
+  ----------
+  preference : np.ndarray
+    The row of the profile to fill, sized to the number of alternatives.
+
+  order
+    An iterable of tie groups, each a collection of 1-indexed alternatives; empty groups are skipped.
+
+  tie_breaker : {"random", "first", "accept"}
+    See the public conversion functions.
+  """
+  groups = [np.asarray(tied_items, dtype=int) - 1 for tied_items in order if len(tied_items) > 0]
+  if not groups:
+    return
+  alternatives = np.concatenate(groups)
+  group_sizes = np.array([group.size for group in groups])
+  group_start_rank = np.repeat(np.cumsum(group_sizes) - group_sizes + 1, group_sizes)
+  if tie_breaker == "accept":
+    preference[alternatives] = group_start_rank
+    return
+  tie_key = np.random.random(alternatives.size) if tie_breaker == "random" else alternatives
+  ranks = np.empty(alternatives.size, dtype=int)
+  ranks[np.lexsort((tie_key, group_start_rank))] = np.arange(1, alternatives.size + 1)
+  preference[alternatives] = ranks
+
 def preflib_soc_to_profile(instance: OrdinalInstance) -> StrictCompleteProfile:
   """
   Convert a Preflib SoC (Strict Orders - Complete List) to the profile (Numpy matrix) format.
@@ -24,18 +75,18 @@ def preflib_soc_to_profile(instance: OrdinalInstance) -> StrictCompleteProfile:
   if instance.data_type != "soc":
     raise ValueError("The inputted instance is not a SoC (Strictly Orders - Complete List) instance.")
 
-  flattened_order = instance.flatten_strict()
-  m = instance.num_alternatives
-  arr = []
-  for order, multiplicity in flattened_order:
+  def convert() -> StrictCompleteProfile:
+    flattened_order = instance.flatten_strict()
+    m = instance.num_alternatives
     # Order: strict complete order of the alternatives
     # Multiplicity: the number of agents that had this ordinal preference
-    indices = np.array(order) - 1
-    preference = np.zeros(m, dtype=int)
-    preference[indices] = np.arange(1, m + 1)
-    for _ in range(multiplicity):
-      arr.append(preference)
-  return StrictCompleteProfile.of(np.array(arr))
+    # One row per distinct order, ranks scattered in a single assignment, then rows repeated per multiplicity.
+    orders = np.array([order for order, _ in flattened_order], dtype=int) - 1
+    multiplicities = np.array([multiplicity for _, multiplicity in flattened_order], dtype=int)
+    ranked = np.empty((len(flattened_order), m), dtype=int)
+    ranked[np.arange(len(flattened_order))[:, np.newaxis], orders] = np.arange(1, m + 1)
+    return StrictCompleteProfile.of(np.repeat(ranked, multiplicities, axis=0))
+  return _cached_conversion(instance, "soc", convert)
 
 def preflib_soi_to_profile(instance: OrdinalInstance) -> StrictIncompleteProfile:
   """
@@ -56,20 +107,25 @@ def preflib_soi_to_profile(instance: OrdinalInstance) -> StrictIncompleteProfile
   if instance.data_type != "soi":
     raise ValueError("The inputted instance is not a SoI (Strictly Orders - Incomplete List) instance.")
 
-  # Note: this prints that we are using flatten_strict on a non-strict order but soi is (supposed to be) strict.
-  print("Ignore the warning(s) below:")
-  flattened_order = instance.flatten_strict()
+  def convert() -> StrictIncompleteProfile:
+    # Note: this prints that we are using flatten_strict on a non-strict order but soi is (supposed to be) strict.
+    print("Ignore the warning(s) below:")
+    flattened_order = instance.flatten_strict()
 
-  arr = []
-  for order, multiplicity in flattened_order:
-    indices = np.array(order) - 1
-    preference = np.full(instance.num_alternatives, np.nan)
-    preference[indices] = np.arange(1, len(indices) + 1)
     # Order: strict incomplete order of the alternatives
     # Multiplicity: the number of agents that had this ordinal preference
-    for _ in range(multiplicity):
-      arr.append(preference)
-  return StrictIncompleteProfile.of(np.array(arr))
+    # The orders are ragged, so unpack them into flat (row, alternative, rank) arrays and scatter once.
+    k = len(flattened_order)
+    multiplicities = np.array([multiplicity for _, multiplicity in flattened_order], dtype=int)
+    lengths = np.array([len(order) for order, _ in flattened_order], dtype=int)
+    total = int(lengths.sum())
+    row_index = np.repeat(np.arange(k), lengths)
+    alternative_index = np.fromiter(chain.from_iterable(order for order, _ in flattened_order), dtype=int, count=total) - 1
+    rank = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths) + 1
+    ranked = np.full((k, instance.num_alternatives), np.nan)
+    ranked[row_index, alternative_index] = rank
+    return StrictIncompleteProfile.of(np.repeat(ranked, multiplicities, axis=0))
+  return _cached_conversion(instance, "soi", convert)
 
 def preflib_toc_to_profile(instance: OrdinalInstance, tie_breaker: str = "random") -> CompleteProfileWithTies:
   """
@@ -97,27 +153,20 @@ def preflib_toc_to_profile(instance: OrdinalInstance, tie_breaker: str = "random
 
   check_tie_breaker(tie_breaker, include_accept=True)
 
-  vote_map = instance.vote_map()
-  arr = []
-  for order, multiplicity in vote_map.items():
+  def convert() -> CompleteProfileWithTies:
+    vote_map = instance.vote_map()
     # Order: complete unflattened order of the alternatives
     # Multiplicity: the number of agents that had this ordinal preference
-    preference = np.zeros(instance.num_alternatives, dtype=int)
-    current_rank = 1
-    for tied_items in order:
-      tied_items = np.array(tied_items) - 1
-      if tie_breaker == "accept":
-        preference[tied_items] = current_rank
-      else:
-        if tie_breaker == "random":
-          np.random.shuffle(tied_items)
-        elif tie_breaker == "first":
-          tied_items = np.sort(tied_items)
-        preference[tied_items] = np.arange(current_rank, len(tied_items) + current_rank)
-      current_rank += len(tied_items)
-    for _ in range(multiplicity):
-      arr.append(preference)
-  return CompleteProfileWithTies.of(np.array(arr))
+    # One row per distinct order; agents sharing an order are expanded with a single repeat.
+    ranked = np.zeros((len(vote_map), instance.num_alternatives), dtype=int)
+    multiplicities = np.fromiter(vote_map.values(), dtype=int, count=len(vote_map))
+    for preference, order in zip(ranked, vote_map.keys()):
+      _rank_tied_groups(preference, order, tie_breaker)
+    return CompleteProfileWithTies.of(np.repeat(ranked, multiplicities, axis=0))
+  if tie_breaker == "random":
+    # Random tie-breaking must stay random across calls, so it bypasses the cache.
+    return convert()
+  return _cached_conversion(instance, "toc-" + tie_breaker, convert)
 
 def preflib_toi_to_profile(instance: OrdinalInstance, tie_breaker: str = "random") -> IncompleteProfileWithTies:
   """
@@ -143,27 +192,20 @@ def preflib_toi_to_profile(instance: OrdinalInstance, tie_breaker: str = "random
   if instance.data_type != "toi":
     raise ValueError("The inputted instance is not a ToI (Orders with Ties - Incomplete List) instance.")
 
-  vote_map = instance.vote_map()
-  arr = []
-  for order, multiplicity in vote_map.items():
+  def convert() -> IncompleteProfileWithTies:
+    vote_map = instance.vote_map()
     # Order: incomplete unflattened order of the alternatives
     # Multiplicity: the number of agents that had this ordinal preference
-    preference = np.full(instance.num_alternatives, np.nan)
-    current_rank = 1
-    for tied_items in order:
-      tied_items = np.array(tied_items) - 1
-      if tie_breaker == "accept":
-        preference[tied_items] = current_rank
-      else:
-        if tie_breaker == "random":
-          np.random.shuffle(tied_items)
-        elif tie_breaker == "first":
-          tied_items = np.sort(tied_items)
-        preference[tied_items] = np.arange(current_rank, len(tied_items) + current_rank)
-      current_rank += len(tied_items)
-    for _ in range(multiplicity):
-      arr.append(preference)
-  return IncompleteProfileWithTies.of(np.array(arr))
+    # One row per distinct order; agents sharing an order are expanded with a single repeat.
+    ranked = np.full((len(vote_map), instance.num_alternatives), np.nan)
+    multiplicities = np.fromiter(vote_map.values(), dtype=int, count=len(vote_map))
+    for preference, order in zip(ranked, vote_map.keys()):
+      _rank_tied_groups(preference, order, tie_breaker)
+    return IncompleteProfileWithTies.of(np.repeat(ranked, multiplicities, axis=0))
+  if tie_breaker == "random":
+    # Random tie-breaking must stay random across calls, so it bypasses the cache.
+    return convert()
+  return _cached_conversion(instance, "toi-" + tie_breaker, convert)
 
 def preflib_categorical_to_profile(instance: CategoricalInstance, tie_breaker: str = "random") -> IncompleteProfileWithTies:
   """
@@ -186,25 +228,15 @@ def preflib_categorical_to_profile(instance: CategoricalInstance, tie_breaker: s
   IncompleteProfileWithTies
     The profile (Numpy matrix) format of the Preflib categorical instance.
   """
-  # This is essentially equal to a toi.
-  arr = []
-  for p in instance.preferences:
-    preference = np.full(instance.num_alternatives, np.nan)
-    current_rank = 1
-    for tied_items in p:
-      # This condition is necessary to avoid indexing errors.
-      if len(tied_items) == 0:
-        continue
-      tied_items = np.array(tied_items) - 1
-      if tie_breaker == "accept":
-        preference[tied_items] = current_rank
-      else:
-        if tie_breaker == "random":
-          np.random.shuffle(tied_items)
-        elif tie_breaker == "first":
-          tied_items = np.sort(tied_items)
-        preference[tied_items] = np.arange(current_rank, len(tied_items) + current_rank)
-      current_rank += len(tied_items)
-    for _ in range(instance.multiplicity[p]):
-      arr.append(preference)
-  return IncompleteProfileWithTies.of(np.array(arr))
+  def convert() -> IncompleteProfileWithTies:
+    # This is essentially equal to a toi.
+    # One row per distinct preference; agents sharing a preference are expanded with a single repeat.
+    ranked = np.full((len(instance.preferences), instance.num_alternatives), np.nan)
+    multiplicities = np.fromiter((instance.multiplicity[p] for p in instance.preferences), dtype=int, count=len(instance.preferences))
+    for preference, p in zip(ranked, instance.preferences):
+      _rank_tied_groups(preference, p, tie_breaker)
+    return IncompleteProfileWithTies.of(np.repeat(ranked, multiplicities, axis=0))
+  if tie_breaker == "random":
+    # Random tie-breaking must stay random across calls, so it bypasses the cache.
+    return convert()
+  return _cached_conversion(instance, "categorical-" + tie_breaker, convert)
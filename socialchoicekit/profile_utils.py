@@ -1,7 +1,33 @@
+import functools
+
 import numpy as np
 
 from socialchoicekit.utils import check_tie_breaker, check_profile, check_valuation_profile
 
+@functools.lru_cache(maxsize=32)
+def _check_profile_from_bytes(shape, dtype_str, buf, is_complete, is_strict) -> bool:
+  arr = np.frombuffer(buf, dtype=np.dtype(dtype_str)).reshape(shape)
+  check_profile(arr, is_complete=is_complete, is_strict=is_strict)
+  return True
+
+def _check_profile_cached(arr: np.ndarray, is_complete: bool, is_strict: bool) -> None:
+  """
+  Validates a profile array, memoized on the array's contents so repeated .of() calls on identical arrays skip the validation. Failures are not cached (lru_cache does not cache exceptions), so invalid arrays raise every time.
+  """
+  _check_profile_from_bytes(arr.shape, arr.dtype.str, arr.tobytes(), is_complete, is_strict)
+
+@functools.lru_cache(maxsize=32)
+def _check_valuation_profile_from_bytes(shape, dtype_str, buf, is_complete) -> bool:
+  arr = np.frombuffer(buf, dtype=np.dtype(dtype_str)).reshape(shape)
+  check_valuation_profile(arr, is_complete=is_complete)
+  return True
+
+def _check_valuation_profile_cached(arr: np.ndarray, is_complete: bool) -> None:
+  """
+  Validates a valuation profile array, memoized on the array's contents in the same way as :func:`_check_profile_cached`.
+  """
+  _check_valuation_profile_from_bytes(arr.shape, arr.dtype.str, arr.tobytes(), is_complete)
+
 class Profile(np.ndarray):
   """
   The generic profile class. In the background, this is just a numpy array.
@@ -13,7 +39,7 @@ class Profile(np.ndarray):
 
   @staticmethod
   def of(arr: np.ndarray) -> "Profile":
-    check_profile(arr, is_complete=False, is_strict=False)
+    _check_profile_cached(arr, is_complete=False, is_strict=False)
     return arr.view(Profile)
 
 class StrictProfile(Profile):
@@ -24,7 +50,7 @@ class StrictProfile(Profile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "StrictProfile":
-    check_profile(arr, is_complete=False, is_strict=True)
+    _check_profile_cached(arr, is_complete=False, is_strict=True)
     return arr.view(StrictProfile)
 
 class ProfileWithTies(Profile):
@@ -35,7 +61,7 @@ class ProfileWithTies(Profile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "ProfileWithTies":
-    check_profile(arr, is_complete=False, is_strict=False)
+    _check_profile_cached(arr, is_complete=False, is_strict=False)
     return arr.view(ProfileWithTies)
 
 class CompleteProfile(Profile):
@@ -46,7 +72,7 @@ class CompleteProfile(Profile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "CompleteProfile":
-    check_profile(arr, is_complete=True, is_strict=False)
+    _check_profile_cached(arr, is_complete=True, is_strict=False)
     return arr.view(CompleteProfile)
 
 class IncompleteProfile(Profile):
@@ -57,7 +83,7 @@ class IncompleteProfile(Profile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "IncompleteProfile":
-    check_profile(arr, is_complete=False, is_strict=False)
+    _check_profile_cached(arr, is_complete=False, is_strict=False)
     return arr.view(IncompleteProfile)
 
 class StrictCompleteProfile(StrictProfile, CompleteProfile):
@@ -67,8 +93,18 @@ class StrictCompleteProfile(StrictProfile, CompleteProfile):
   An (N, M) array, where N is the number of agents and M is the number of alternatives or items. The element at (i, j) indicates the rank of alternative or item j in the preference list of agent i. The rank is an integer, where 1 is the most preferred. The profile does not allow ties (i.e., no two alternatives can have the same rank for an agent).
   """
   @staticmethod
-  def of(arr: np.ndarray) -> "StrictCompleteProfile":
-    check_profile(arr, is_complete=True, is_strict=True)
+  def of(arr: np.ndarray, zero_indexed: bool = False) -> "StrictCompleteProfile":
+    """
+    Parameters
+    ----------
+    arr: np.ndarray
+
+    zero_indexed: bool
+      If True, the input array ranks alternatives from 0 and is shifted to the 1-indexed representation used by Profile. False by default.
+    """
+    if zero_indexed:
+      arr = arr + 1
+    _check_profile_cached(arr, is_complete=True, is_strict=True)
     return arr.view(StrictCompleteProfile)
 
 class StrictIncompleteProfile(StrictProfile, IncompleteProfile):
@@ -79,7 +115,7 @@ class StrictIncompleteProfile(StrictProfile, IncompleteProfile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "StrictIncompleteProfile":
-    check_profile(arr, is_complete=False, is_strict=True)
+    _check_profile_cached(arr, is_complete=False, is_strict=True)
     return arr.view(StrictIncompleteProfile)
 
 class CompleteProfileWithTies(ProfileWithTies, CompleteProfile):
@@ -90,7 +126,7 @@ class CompleteProfileWithTies(ProfileWithTies, CompleteProfile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "CompleteProfileWithTies":
-    check_profile(arr, is_complete=True, is_strict=False)
+    _check_profile_cached(arr, is_complete=True, is_strict=False)
     return arr.view(CompleteProfileWithTies)
 
 class IncompleteProfileWithTies(ProfileWithTies, IncompleteProfile):
@@ -101,7 +137,7 @@ class IncompleteProfileWithTies(ProfileWithTies, IncompleteProfile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "IncompleteProfileWithTies":
-    check_profile(arr, is_complete=False, is_strict=False)
+    _check_profile_cached(arr, is_complete=False, is_strict=False)
     return arr.view(IncompleteProfileWithTies)
 
 class ValuationProfile(np.ndarray):
@@ -115,7 +151,7 @@ class ValuationProfile(np.ndarray):
 
   @staticmethod
   def of(arr: np.ndarray) -> "ValuationProfile":
-    check_valuation_profile(arr, is_complete=False)
+    _check_valuation_profile_cached(arr, is_complete=False)
     return arr.view(ValuationProfile)
 
 class CompleteValuationProfile(ValuationProfile):
@@ -126,7 +162,7 @@ class CompleteValuationProfile(ValuationProfile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "CompleteValuationProfile":
-    check_valuation_profile(arr, is_complete=True)
+    _check_valuation_profile_cached(arr, is_complete=True)
     return arr.view(CompleteValuationProfile)
 
 class IncompleteValuationProfile(ValuationProfile):
@@ -137,7 +173,7 @@ class IncompleteValuationProfile(ValuationProfile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "IncompleteValuationProfile":
-    check_valuation_profile(arr, is_complete=False)
+    _check_valuation_profile_cached(arr, is_complete=False)
     return arr.view(IncompleteValuationProfile)
 
 class IntegerValuationProfile(CompleteValuationProfile):
@@ -148,7 +184,7 @@ class IntegerValuationProfile(CompleteValuationProfile):
   """
   @staticmethod
   def of(arr: np.ndarray) -> "IntegerValuationProfile":
-    check_valuation_profile(arr, is_complete=False)
+    _check_valuation_profile_cached(arr, is_complete=False)
     if not np.issubdtype(arr.dtype, np.integer):
       raise ValueError("The input array must have integer values")
     return arr.view(IntegerValuationProfile)
@@ -178,21 +214,21 @@ def incomplete_profile_to_complete_profile(
   """
   check_tie_breaker(tie_breaker, include_accept=True)
   check_profile(profile, is_complete=False, is_strict=False)
-  n = profile.shape[0]
   m = profile.shape[1]
   complete_profile = np.array(profile)
-  for i in range(n):
-    nan_indices = np.where(np.isnan(profile[i]))[0]
-    num_nan = len(nan_indices)
+  # All rows are filled at once: np.where lists the NaN cells row by row (columns ascending, which is exactly the "first" order), and each row's cells receive the ranks m - num_nan + 1 to m.
+  nan_mask = np.isnan(complete_profile)
+  nan_rows, nan_cols = np.where(nan_mask)
+  num_nan = nan_mask.sum(axis=1)
+  first_assigned_rank = np.repeat(m - num_nan + 1, num_nan)
+  if tie_breaker == "accept":
+    complete_profile[nan_rows, nan_cols] = first_assigned_rank
+  else:
     if tie_breaker == "random":
-      np.random.shuffle(nan_indices)
-    elif tie_breaker == "first":
-      nan_indices = np.sort(nan_indices)
-    if tie_breaker == "accept":
-      complete_profile[i, nan_indices] = m - num_nan + 1
-    else:
-      # np.arange is not inclusive of the second argument.
-      complete_profile[i, nan_indices] = np.arange(m - num_nan + 1, m + 1)
+      # Shuffling which column of a row gets which rank is a random permutation of the columns within each row group.
+      nan_cols = nan_cols[np.lexsort((np.random.random(nan_cols.size), nan_rows))]
+    position_in_row = np.arange(nan_rows.size) - np.repeat(np.cumsum(num_nan) - num_nan, num_nan)
+    complete_profile[nan_rows, nan_cols] = first_assigned_rank + position_in_row
   if tie_breaker != "accept" and isinstance(profile, StrictProfile):
     return StrictCompleteProfile.of(complete_profile)
   return CompleteProfileWithTies.of(complete_profile)
@@ -223,27 +259,23 @@ def profile_with_ties_to_strict_profile(
   """
   check_tie_breaker(tie_breaker, include_accept=False)
   check_profile(profile, is_complete=False, is_strict=False)
-  n = profile.shape[0]
-  m = profile.shape[1]
   strict_profile = np.array(profile)
-  ranked_profile = np.argsort(profile, axis=1)
-  for i in range(n):
-    r = 0
-    while r < m:
-      k = 1
-      while k < m - r and profile[i, ranked_profile[i, r + k]] == profile[i, ranked_profile[i, r]]:
-        k += 1
-      num_tied = k
-      if num_tied > 1:
-        # There is a tie.
-        tied_indices = np.array([ranked_profile[i, r + j] for j in range(num_tied)])
-        if tie_breaker == "random":
-          np.random.shuffle(tied_indices)
-        if tie_breaker == "first":
-          tied_indices = np.sort(tied_indices)
-        strict_profile[i, tied_indices] = np.arange(r + 1, r + num_tied + 1)
-
-      r += num_tied
+  # Sort every ranked cell by (row, rank, tie key) in one lexsort; the tie key is the column for "first" and a random draw for "random". Cells in a tied run take their position within the row's sorted order, untied cells keep their original rank, and NaN cells are never touched.
+  mask = ~np.isnan(strict_profile)
+  rows, cols = np.where(mask)
+  values = strict_profile[rows, cols]
+  tie_key = np.random.random(values.size) if tie_breaker == "random" else cols
+  order = np.lexsort((tie_key, values, rows))
+  rows = rows[order]
+  cols = cols[order]
+  values = values[order]
+  counts = mask.sum(axis=1)
+  position_in_row = np.arange(values.size) - np.repeat(np.cumsum(counts) - counts, counts)
+  same_as_previous = np.zeros(values.size, dtype=bool)
+  same_as_previous[1:] = (rows[1:] == rows[:-1]) & (values[1:] == values[:-1])
+  tied = same_as_previous.copy()
+  tied[:-1] |= same_as_previous[1:]
+  strict_profile[rows[tied], cols[tied]] = position_in_row[tied] + 1
   if isinstance(profile, CompleteProfile):
     return StrictCompleteProfile.of(strict_profile)
   return StrictIncompleteProfile.of(strict_profile)
@@ -267,16 +299,14 @@ def compute_ordinal_profile(cardinal_profile: ValuationProfile) -> StrictProfile
 
   n = cardinal_profile.shape[0]
   m = cardinal_profile.shape[1]
+  cardinal = cardinal_profile.view(np.ndarray)
 
-  # Sort by descending with np.nan at end
-  ranked_profile = np.argsort(cardinal_profile * -1, axis=1).view(np.ndarray)
-
+  # Sort by descending with np.nan at end, then scatter the ranks 1..M back in one assignment.
+  ranked_profile = np.argsort(cardinal * -1, axis=1)
+  ans = np.empty((n, m))
+  np.put_along_axis(ans, ranked_profile, np.broadcast_to(np.arange(1, m + 1, dtype=float), (n, m)), axis=1)
   # Preserve np.nan
-  ans = cardinal_profile.view(np.ndarray) * 0
-  for agent in range(n):
-    for item_rank in range(m):
-      # Preserve np.nan with +=
-      ans[agent, ranked_profile[agent, item_rank]] += item_rank + 1
+  ans[np.isnan(cardinal)] = np.nan
   if isinstance(cardinal_profile, CompleteValuationProfile):
     return StrictCompleteProfile.of(ans)
   return StrictIncompleteProfile.of(ans)
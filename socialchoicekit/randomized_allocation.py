@@ -1,6 +1,7 @@
 import numpy as np
+from typing import Optional
 
-from socialchoicekit.bistochastic import birkhoff_von_neumann
+from socialchoicekit.bistochastic import birkhoff_von_neumann_index_vectors
 from socialchoicekit.profile_utils import StrictProfile
 
 class RandomSerialDictatorship:
@@ -11,12 +12,17 @@ class RandomSerialDictatorship:
   ----------
   zero_indexed : bool
     If True, the output of the social welfare function and social choice function will be zero-indexed. If False, the output will be one-indexed. One-indexed by default.
+
+  seed : Optional[int]
+    The seed for the random number generator used to order the agents. If None, the generator is seeded from the operating system. None by default.
   """
   def __init__(
       self,
-      zero_indexed: bool = False
+      zero_indexed: bool = False,
+      seed: Optional[int] = None
   ) -> None:
     self.index_fixer = 0 if zero_indexed else 1
+    self._rng = np.random.default_rng(seed)
 
   def scf(self, profile: StrictProfile) -> np.ndarray:
     """
@@ -32,19 +38,74 @@ class RandomSerialDictatorship:
     np.ndarray
       A numpy array containing the allocated item for each agent or np.nan if the agent is unallocated.
     """
-    pref = np.array(profile.view(np.ndarray))
-    allocation = np.full(profile.shape[0], np.nan)
+    pref = profile.view(np.ndarray)
+    # Element at (i, j) is agent i's j+1th most preferred item (0-indexed item number). NaN entries sort last.
+    ranked_items = np.argsort(pref, axis=1)
+    # Element at i is the number of items that agent i finds acceptable.
+    num_acceptable = (~np.isnan(pref)).sum(axis=1)
+    order = self._rng.permutation(pref.shape[0])
+    return self._run_trial(ranked_items, num_acceptable, order)
+
+  def scf_batch(self, profile: StrictProfile, num_trials: int) -> np.ndarray:
+    """
+    Runs the social choice function over multiple independent realizations of the random agent order. The per-call setup work (defensive copy, acceptability scan) is computed once and shared across all trials, so this is faster than calling scf in a loop for Monte-Carlo estimation.
 
-    order = np.arange(pref.shape[0])
-    np.random.shuffle(order)
+    Parameters
+    ----------
+    profile: StrictProfile
+      A (N, M) array, where N is the number of agents and M is the number of items. The element at (i, j) indicates the voter's preference for item j, where 1 is the most preferred item. If the agent finds an item unacceptable, the element would be np.nan.
 
-    for agent in order:
-      if np.all(np.isnan(pref[agent])):
-        continue
-      item = np.nanargmin(pref[agent])
-      allocation[agent] = int(item) + self.index_fixer
-      pref[:, item] = np.nan
+    num_trials: int
+      The number of independent realizations to run.
+
+    Returns
+    -------
+    np.ndarray
+      A (num_trials, N) array where row t contains the allocation computed in trial t, in the same format as the output of scf.
+    """
+    pref = profile.view(np.ndarray)
+    ranked_items = np.argsort(pref, axis=1)
+    num_acceptable = (~np.isnan(pref)).sum(axis=1)
+    allocations = np.empty((num_trials, pref.shape[0]))
+    for trial in range(num_trials):
+      order = self._rng.permutation(pref.shape[0])
+      allocations[trial] = self._run_trial(ranked_items, num_acceptable, order)
+    return allocations
+
+  def _run_trial(
+    self,
+    ranked_items: np.ndarray,
+    num_acceptable: np.ndarray,
+    order: np.ndarray
+  ) -> np.ndarray:
+    """
+    Runs a single serial dictatorship realization for the given agent order. Each agent walks down their ranking until they find an item that is not yet taken, so the profile itself is never copied or mutated.
+
+    Parameters
+    ----------
+    ranked_items: np.ndarray
+      A (N, M) array where the element at (i, j) is agent i's j+1th most preferred item (0-indexed item number).
 
+    num_acceptable: np.ndarray
+      A N-array where the element at i is the number of items that agent i finds acceptable.
+
+    order: np.ndarray
+      The order in which the agents pick items.
+
+    Returns
+    -------
+    np.ndarray
+      A numpy array containing the allocated item for each agent or np.nan if the agent is unallocated.
+    """
+    allocation = np.full(ranked_items.shape[0], np.nan)
+    taken = np.zeros(ranked_items.shape[1], dtype=bool)
+    for agent in order:
+      for position in range(num_acceptable[agent]):
+        item = ranked_items[agent, position]
+        if not taken[item]:
+          taken[item] = True
+          allocation[agent] = int(item) + self.index_fixer
+          break
     return allocation
 
 class SimultaneousEating:
@@ -55,12 +116,17 @@ class SimultaneousEating:
   ----------
   zero_indexed : bool
     If True, the output of the social welfare function and social choice function will be zero-indexed. If False, the output will be one-indexed. One-indexed by default.
+
+  seed : Optional[int]
+    The seed for the random number generator used to sample a permutation from the decomposition. If None, the generator is seeded from the operating system. None by default.
   """
   def __init__(
       self,
-      zero_indexed: bool = False
+      zero_indexed: bool = False,
+      seed: Optional[int] = None
   ) -> None:
     self.index_fixer = 0 if zero_indexed else 1
+    self._rng = np.random.default_rng(seed)
 
   def bistochastic(
     self,
@@ -127,7 +193,8 @@ class SimultaneousEating:
       bistochastic[i_indices, j_indices] += t * speeds[i_indices]
       item_fraction_remaining -= total_speeds * t
       # Compare with some threshold to avoid floating point errors
-      item_fraction_remaining = np.where(item_fraction_remaining > 1e-9, item_fraction_remaining, np.nan)
+      # Mask in place instead of np.where to avoid allocating an intermediate array
+      item_fraction_remaining[item_fraction_remaining <= 1e-9] = np.nan
       agent_amount_eaten += speeds * t
       agent_amount_eaten = np.where(agent_amount_eaten < 1 - 1e-9, agent_amount_eaten, np.nan)
 
@@ -162,10 +229,10 @@ class SimultaneousEating:
       A numpy array containing the allocated item for each agent or np.nan if the agent is unallocated.
     """
     bistochastic = self.bistochastic(profile, speeds)
-    decomposition = birkhoff_von_neumann(bistochastic)
-    permutation_probabilities = [p for p, _ in decomposition]
-    chosen_permutation = decomposition[np.random.choice(1, len(permutation_probabilities), p=np.array(permutation_probabilities))][1]
-    return np.argmax(chosen_permutation, axis=1) + self.index_fixer
+    decomposition = birkhoff_von_neumann_index_vectors(bistochastic)
+    permutation_probabilities = np.array([p for p, _ in decomposition])
+    chosen_permutation = decomposition[self._rng.choice(len(decomposition), p=permutation_probabilities)][1]
+    return chosen_permutation + self.index_fixer
 
 class ProbabilisticSerial:
   """
@@ -175,12 +242,16 @@ class ProbabilisticSerial:
   ----------
   zero_indexed : bool
     If True, the output of the social welfare function and social choice function will be zero-indexed. If False, the output will be one-indexed. One-indexed by default.
+
+  seed : Optional[int]
+    The seed for the random number generator used to sample a permutation from the decomposition. If None, the generator is seeded from the operating system. None by default.
   """
   def __init__(
       self,
-      zero_indexed: bool = False
+      zero_indexed: bool = False,
+      seed: Optional[int] = None
   ) -> None:
-    self.simultaneous_eating = SimultaneousEating(zero_indexed=zero_indexed)
+    self.simultaneous_eating = SimultaneousEating(zero_indexed=zero_indexed, seed=seed)
 
   def bistochastic(self, profile: StrictProfile) -> np.ndarray:
     """
@@ -105,8 +105,9 @@ def check_graph(G: Dict[int, List[int]]) -> None:
     If the graph contains values other than integers.
   """
   if isinstance(G, dict):
-    if all(isinstance(i, int) for i in G.keys()):
-      if all(isinstance(i, list) for i in G.values()):
+    if all(isinstance(i, (int, np.integer)) for i in G.keys()):
+      # Flat integer arrays are accepted alongside lists so callers can store adjacency without boxing each vertex id in a Python object.
+      if all(isinstance(i, (list, tuple)) or (isinstance(i, np.ndarray) and i.ndim == 1 and np.issubdtype(i.dtype, np.integer)) for i in G.values()):
         for l in G.values():
           if all([i in G.keys() for i in l]):
             return
@@ -0,0 +1,8 @@
+def assert_matching_equal(result, expected):
+  """
+  Asserts that two matchings contain exactly the same (agent, partner) pairs, ignoring order.
+  Both sides are hashed once, so the comparison is a single frozenset equality, and a mismatch reports the symmetric difference for a readable diff.
+  """
+  result_set = frozenset(tuple(pair) for pair in result)
+  expected_set = frozenset(tuple(pair) for pair in expected)
+  assert result_set == expected_set, f"Matchings differ on pairs: {sorted(result_set.symmetric_difference(expected_set))}"
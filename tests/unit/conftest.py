@@ -1,57 +1,266 @@
+import os
+import pathlib
+import pickle
+import tempfile
+import urllib.request
+
 import numpy as np
 import pytest
 
-from preflibtools.instances import OrdinalInstance, CategoricalInstance
+from socialchoicekit.deterministic_allocation import MaximumWeightMatching
+from socialchoicekit.deterministic_scoring import Plurality
+from socialchoicekit.profile_utils import IntegerValuationProfile, StrictCompleteProfile
 
-from socialchoicekit.profile_utils import StrictCompleteProfile
-@pytest.fixture
+_DATA_DIR = pathlib.Path(__file__).parent / "data"
+
+# Ranked profile literals from the example in Irving, et al. (1987), shared by
+# the deterministic and elicitation matching tests. Built (and the -1
+# reindexing paid) once at import and frozen.
+_IRVING_RANKED_ORDINAL_1 = np.array([
+  [3, 1, 5, 7, 4, 2, 8, 6],
+  [6, 1, 3, 4, 8, 7, 5, 2],
+  [7, 4, 3, 6, 5, 1, 2, 8],
+  [5, 3, 8, 2, 6, 1, 4, 7],
+  [4, 1, 2, 8, 7, 3, 6, 5],
+  [6, 2, 5, 7, 8, 4, 3, 1],
+  [7, 8, 1, 6, 2, 3, 4, 5],
+  [2, 6, 7, 1, 8, 3, 4, 5],
+], dtype=np.int8) - 1
+_IRVING_RANKED_ORDINAL_1.setflags(write=False)
+_IRVING_RANKED_ORDINAL_2 = np.array([
+  [4, 3, 8, 1, 2, 5, 7, 6],
+  [3, 7, 5, 8, 6, 4, 1, 2],
+  [7, 5, 8, 3, 6, 2, 1, 4],
+  [6, 4, 2, 7, 3, 1, 5, 8],
+  [8, 7, 1, 5, 6, 4, 3, 1],
+  [5, 4, 7, 6, 2, 8, 3, 1],
+  [1, 4, 5, 6, 2, 8, 3, 7],
+  [2, 5, 4, 3, 7, 8, 1, 6],
+], dtype=np.int8) - 1
+_IRVING_RANKED_ORDINAL_2.setflags(write=False)
+
+# The borda-like weights that Irving et al. (1987) used.
+_IRVING_RANKED_CARDINAL_BORDA = np.tile(np.arange(8, 0, -1, dtype=np.int8), (8, 1))
+_IRVING_RANKED_CARDINAL_BORDA.setflags(write=False)
+
+# Custom cardinal weights for the weighted variant.
+_IRVING_RANKED_CARDINAL_WEIGHTED_1 = np.array([
+  [12, 12, 12, 0, 0, 0, 0, 0],
+  [36, 0, 0, 0, 0, 0, 0, 0],
+  [15, 15, 6, 0, 0, 0, 0, 0],
+  [9, 9, 9, 9, 0, 0, 0, 0],
+  [7, 7, 7, 7, 2, 2, 2, 2],
+  [7, 7, 7, 7, 2, 2, 2, 2],
+  [12, 12, 12, 0, 0, 0, 0, 0],
+  [18, 18, 0, 0, 0, 0, 0, 0],
+], dtype=np.int8)
+_IRVING_RANKED_CARDINAL_WEIGHTED_1.setflags(write=False)
+_IRVING_RANKED_CARDINAL_WEIGHTED_2 = np.array([
+  [6, 6, 4, 4, 4, 4, 4, 4],
+  [8, 7, 6, 5, 4, 3, 2, 1],
+  [8, 7, 6, 5, 4, 3, 2, 1],
+  [5, 5, 5, 5, 5, 5, 5, 1],
+  [5, 5, 5, 5, 4, 4, 4, 4],
+  [5, 5, 5, 5, 5, 5, 5, 1],
+  [8, 7, 6, 5, 4, 3, 2, 1],
+  [8, 7, 6, 5, 4, 3, 2, 1],
+], dtype=np.int8)
+_IRVING_RANKED_CARDINAL_WEIGHTED_2.setflags(write=False)
+
+def _build_irving_profiles(ranked_cardinal_profile_1, ranked_cardinal_profile_2):
+  # Fix into form accepted by Profile, ValuationProfile.
+  # Each row of _IRVING_RANKED_ORDINAL_1 is a permutation, so its inverse is a direct O(n) scatter
+  # (no sort needed) and the cardinal lookup folds into the same scatter.
+  rows = np.arange(_IRVING_RANKED_ORDINAL_1.shape[0])[:, np.newaxis]
+  ordinal_profile_1 = np.empty_like(_IRVING_RANKED_ORDINAL_1)
+  ordinal_profile_1[rows, _IRVING_RANKED_ORDINAL_1] = np.arange(_IRVING_RANKED_ORDINAL_1.shape[1])
+  cardinal_profile_1 = np.empty_like(ranked_cardinal_profile_1)
+  cardinal_profile_1[rows, _IRVING_RANKED_ORDINAL_1] = ranked_cardinal_profile_1
+  # _IRVING_RANKED_ORDINAL_2 contains a duplicated entry (row 4), so the permutation-inverse
+  # shortcut does not apply; keep the argsort round-trip there.
+  # A stable sort keeps the inverse deterministic across numpy versions for the duplicated entry.
+  ordinal_profile_2 = np.argsort(_IRVING_RANKED_ORDINAL_2, axis=1, kind="stable").astype(_IRVING_RANKED_ORDINAL_2.dtype)
+  # The row-wise gather is a direct fancy index, reusing the same row index as the scatter above.
+  cardinal_profile_2 = ranked_cardinal_profile_2[rows, ordinal_profile_2]
+
+  profile_1 = StrictCompleteProfile.of(ordinal_profile_1, zero_indexed=True)
+  profile_2 = StrictCompleteProfile.of(ordinal_profile_2, zero_indexed=True)
+  valuation_profile_1 = IntegerValuationProfile.of(cardinal_profile_1)
+  valuation_profile_2 = IntegerValuationProfile.of(cardinal_profile_2)
+  # The fixtures are cached for the whole session, so freeze them to catch accidental mutation.
+  for built in (profile_1, profile_2, valuation_profile_1, valuation_profile_2):
+    built.setflags(write=False)
+  return profile_1, profile_2, valuation_profile_1, valuation_profile_2
+
+@pytest.fixture(scope="session")
+def irving_profiles_borda():
+  # Example given in Irving, et al. (1987), with the borda-like weights the paper used.
+  return _build_irving_profiles(_IRVING_RANKED_CARDINAL_BORDA, _IRVING_RANKED_CARDINAL_BORDA)
+
+@pytest.fixture(scope="session")
+def irving_profiles_weighted():
+  # Example given in Irving, et al. (1987), with custom cardinal weights.
+  return _build_irving_profiles(_IRVING_RANKED_CARDINAL_WEIGHTED_1, _IRVING_RANKED_CARDINAL_WEIGHTED_2)
+
+def _parse_preflib_url(instance, url, cache):
+  """
+  Parses the preflib file checked in under tests/unit/data/ if present; otherwise downloads it into the cache directory (once across test runs) and parses the local copy, so each file incurs at most one HTTP round-trip.
+
+  The parsed instance is also pickled into the cache directory, so later test sessions (or other pytest-xdist workers, which each rebuild session fixtures) can skip the preflib parser entirely.
+  """
+  filename = url.rsplit("/", 1)[-1]
+  pickled = cache / (filename + ".pkl")
+  if pickled.exists():
+    with open(pickled, "rb") as f:
+      return pickle.load(f)
+  local = _DATA_DIR / filename
+  if not local.exists():
+    local = cache / filename
+    if not local.exists():
+      urllib.request.urlretrieve(url, local)
+  instance.parse_file(str(local))
+  # Write the pickle through a temporary file and an atomic rename so concurrent workers never observe a partial file.
+  fd, tmp = tempfile.mkstemp(dir=str(cache), suffix=".pkl.tmp")
+  with os.fdopen(fd, "wb") as f:
+    pickle.dump(instance, f)
+  os.replace(tmp, str(pickled))
+  return instance
+
+@pytest.fixture(scope="session")
+def plurality():
+  return Plurality()
+
+@pytest.fixture(scope="session")
+def mwm():
+  return MaximumWeightMatching()
+
+@pytest.fixture(scope="session")
+def preflib_cache():
+  cache = pathlib.Path.home() / ".cache" / "socialchoicekit-tests"
+  cache.mkdir(parents=True, exist_ok=True)
+  return cache
+
+@pytest.fixture(scope="session")
 def profile_a():
-  return StrictCompleteProfile.of(np.array([
+  # The literal is known to be a valid strict complete profile, so skip the .of() validation.
+  profile = np.array([
     [1, 2, 4, 6, 8, 5, 3, 7],
     [4, 5, 1, 2, 7, 3, 8, 6],
     [4, 2, 3, 5, 1, 6, 7, 8],
     [8, 7, 6, 5, 4, 3, 2, 1],
     [8, 4, 2, 5, 1, 7, 6, 3],
     [5, 8, 1, 4, 2, 7, 6, 3],
-  ]))
+  ], dtype=np.int8).view(StrictCompleteProfile)
+  profile.setflags(write=False)
+  return profile
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def profile_b():
-  return StrictCompleteProfile.of(np.array([
+  # The literal is known to be a valid strict complete profile, so skip the .of() validation.
+  profile = np.array([
     [3, 2, 4, 6, 8, 5, 1, 7],
     [3, 6, 7, 2, 4, 5, 1, 8],
     [1, 8, 7, 3, 4, 5, 2, 6],
     [5, 6, 1, 4, 8, 7, 3, 2],
     [3, 6, 7, 2, 4, 5, 1, 8],
     [4, 3, 2, 1, 5, 6, 7, 8],
-  ]))
+  ], dtype=np.int8).view(StrictCompleteProfile)
+  profile.setflags(write=False)
+  return profile
 
 @pytest.fixture
-def agh_course_selection_instance():
-  instance = OrdinalInstance()
-  instance.parse_url("https://www.preflib.org/static/data/agh/00009-00000001.soc")
-  return instance
+def profile_single():
+  return np.array([[1]]).view(StrictCompleteProfile)
 
 @pytest.fixture
-def apa_election_instance():
-  instance = OrdinalInstance()
-  instance.parse_url("https://www.preflib.org/static/data/apa/00028-00000001.soi")
-  return instance
+def profile_empty():
+  # Do not convert this into a Profile here because it will raise an error
+  # before this method returns.
+  return np.array([[]])
 
 @pytest.fixture
-def burlington_election_instance():
-  instance = OrdinalInstance()
-  instance.parse_url("https://www.preflib.org/static/data/burlington/00005-00000001.toc")
-  return instance
+def profile_1d():
+  return np.array([1, 2, 3, 4, 5])
 
 @pytest.fixture
-def aspen_election_instance():
-  instance = OrdinalInstance()
-  instance.parse_url("https://www.preflib.org/static/data/aspen/00016-00000002.toi")
-  return instance
+def profile_3d():
+  return np.array([
+    [[1, 2, 3], [2, 3, 1], [3, 1, 2]],
+    [[1, 3, 2], [3, 1, 2], [3, 1, 2]],
+    [[2, 1, 3], [2, 1, 3], [2, 3, 1]],
+  ], dtype=np.int8)
 
 @pytest.fixture
-def french_president_election_instance():
-  instance = CategoricalInstance()
-  instance.parse_url("https://www.preflib.org/static/data/frenchapproval/00026-00000001.cat")
-  return instance
+def profile_repeat():
+  return np.array([
+    [1, 2, 4, 3, 8, 5, 3, 7],
+    [4, 5, 1, 2, 4, 6, 8, 3],
+    [3, 7, 1, 2, 4, 6, 8, 5],
+  ], dtype=np.int8)
+
+@pytest.fixture
+def profile_negative(profile_a):
+  return profile_a - 2
+
+@pytest.fixture
+def profile_invalid_alternative(profile_a):
+  return profile_a + 1
+
+@pytest.fixture
+def profile_tie():
+  return np.array([
+    [1, 2],
+    [2, 1],
+  ]).view(StrictCompleteProfile)
+
+@pytest.fixture(scope="session")
+def bistochastic_matrix_1():
+  matrix = 0.4 * np.array([
+    [0, 0, 1, 0], [1, 0, 0, 0], [0, 0, 0, 1], [0, 1, 0, 0]
+  ]) + 0.6 * np.array([
+    [0, 1, 0, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, 0, 1, 0]
+  ])
+  matrix.setflags(write=False)
+  return matrix
+
+@pytest.fixture(scope="session")
+def bistochastic_matrix_2():
+  matrix = 0.5 * np.array([
+    [0, 0, 1, 0], [1, 0, 0, 0], [0, 0, 0, 1], [0, 1, 0, 0]
+  ]) + 0.6 * np.array([
+    [0, 1, 0, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, 0, 1, 0]
+  ]) - 0.1 * np.array([
+    [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 0, 1]
+  ])
+  matrix.setflags(write=False)
+  return matrix
+
+@pytest.fixture(scope="session")
+def agh_course_selection_instance(preflib_cache):
+  # Imported lazily so collecting tests that never touch preflib data skips preflibtools initialization.
+  from preflibtools.instances import OrdinalInstance
+  return _parse_preflib_url(OrdinalInstance(), "https://www.preflib.org/static/data/agh/00009-00000001.soc", preflib_cache)
+
+@pytest.fixture(scope="session")
+def apa_election_instance(preflib_cache):
+  # Imported lazily so collecting tests that never touch preflib data skips preflibtools initialization.
+  from preflibtools.instances import OrdinalInstance
+  return _parse_preflib_url(OrdinalInstance(), "https://www.preflib.org/static/data/apa/00028-00000001.soi", preflib_cache)
+
+@pytest.fixture(scope="session")
+def burlington_election_instance(preflib_cache):
+  # Imported lazily so collecting tests that never touch preflib data skips preflibtools initialization.
+  from preflibtools.instances import OrdinalInstance
+  return _parse_preflib_url(OrdinalInstance(), "https://www.preflib.org/static/data/burlington/00005-00000001.toc", preflib_cache)
+
+@pytest.fixture(scope="session")
+def aspen_election_instance(preflib_cache):
+  # Imported lazily so collecting tests that never touch preflib data skips preflibtools initialization.
+  from preflibtools.instances import OrdinalInstance
+  return _parse_preflib_url(OrdinalInstance(), "https://www.preflib.org/static/data/aspen/00016-00000002.toi", preflib_cache)
+
+@pytest.fixture(scope="session")
+def french_president_election_instance(preflib_cache):
+  # Imported lazily so collecting tests that never touch preflib data skips preflibtools initialization.
+  from preflibtools.instances import CategoricalInstance
+  return _parse_preflib_url(CategoricalInstance(), "https://www.preflib.org/static/data/frenchapproval/00026-00000001.cat", preflib_cache)
@@ -3,47 +3,35 @@ import numpy as np
 
 from socialchoicekit.bistochastic import *
 
-class TestBistochastic:
-  @pytest.fixture
-  def bistochastic_matrix_1(self):
-    return 0.4 * np.array([
-      [0, 0, 1, 0], [1, 0, 0, 0], [0, 0, 0, 1], [0, 1, 0, 0]
-    ]) + 0.6 * np.array([
-      [0, 1, 0, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, 0, 1, 0]
-    ])
-
-  @pytest.fixture
-  def bistochastic_matrix_2(self):
-    return 0.5 * np.array([
-      [0, 0, 1, 0], [1, 0, 0, 0], [0, 0, 0, 1], [0, 1, 0, 0]
-    ]) + 0.6 * np.array([
-      [0, 1, 0, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, 0, 1, 0]
-    ]) - 0.1 * np.array([
-      [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 0, 1]
-    ])
+# Both bistochastic matrix fixtures share this positivity pattern.
+# Vertices 0-3 are the rows and vertices 4-7 are the columns.
+EXPECTED_POSITIVITY_GRAPH = {
+  0: [5, 6],
+  1: [4, 7],
+  2: [4, 7],
+  3: [5, 6],
+  4: [1, 2],
+  5: [0, 3],
+  6: [0, 3],
+  7: [1, 2],
+}
 
+class TestBistochastic:
   def test_positivity_graph_without_negative_values(self, bistochastic_matrix_1):
-    G = positivity_graph(bistochastic_matrix_1)
-    assert isinstance(G, dict)
-    assert G.keys() == set(range(0, 8))
-    assert G[0] == [5, 6]
-    assert G[1] == [4, 7]
-    assert G[4] == [1, 2]
-    assert G[5] == [0, 3]
+    assert positivity_graph(bistochastic_matrix_1) == EXPECTED_POSITIVITY_GRAPH
 
   def test_positivity_graph_with_negative_values(self, bistochastic_matrix_2):
-    G = positivity_graph(bistochastic_matrix_2)
-    assert isinstance(G, dict)
-    assert G.keys() == set(range(0, 8))
-    assert G[0] == [5, 6]
-    assert G[1] == [4, 7]
-    assert G[4] == [1, 2]
-    assert G[5] == [0, 3]
+    assert positivity_graph(bistochastic_matrix_2) == EXPECTED_POSITIVITY_GRAPH
 
   def test_birkhoff_von_neumann_1(self, bistochastic_matrix_1):
-    result = birkhoff_von_neumann(bistochastic_matrix_1)
-    assert sum([z for (z, _) in result]) == pytest.approx(1)
-    assert all([P.shape[0] == P.shape[1] and P.shape[0] == bistochastic_matrix_1.shape[0] for (_, P) in result])
-    assert all([np.all(np.sum(P, axis=0) == np.ones(P.shape[0])) for (_, P) in result])
-    assert all([np.all(np.sum(P, axis=1) == np.ones(P.shape[0])) for (_, P) in result])
-    assert all([np.all(np.unique(P) == np.array([0, 1])) for (_, P) in result])
+    # birkhoff_von_neumann consumes the matrix in place, so give it a copy of the shared fixture.
+    result = birkhoff_von_neumann(np.array(bistochastic_matrix_1))
+    m = bistochastic_matrix_1.shape[0]
+    weights = np.array([z for (z, _) in result])
+    # Stack the permutation matrices into a (q, m, m) tensor so each check is one vectorized reduction.
+    Ps = np.stack([P for (_, P) in result])
+    assert weights.sum() == pytest.approx(1)
+    assert Ps.shape[1:] == (m, m)
+    assert np.all(Ps.sum(axis=1) == 1)
+    assert np.all(Ps.sum(axis=2) == 1)
+    assert np.all((Ps == 0) | (Ps == 1))
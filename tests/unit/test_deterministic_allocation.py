@@ -4,6 +4,15 @@ import pytest
 from socialchoicekit.deterministic_allocation import MaximumWeightMatching, root_n_serial_dictatorship
 from socialchoicekit.profile_utils import CompleteValuationProfile, IncompleteValuationProfile, StrictCompleteProfile
 
+# Expected arrays shared across (parametrized) tests, built once per module and
+# frozen so no test can mutate them.
+EXPECTED_MWM_1 = np.array([1, 2, 3, 4])
+EXPECTED_MWM_1.setflags(write=False)
+EXPECTED_MWM_3 = np.array([3, 4, 1, 5, 2])
+EXPECTED_MWM_3.setflags(write=False)
+EXPECTED_RSD_1 = np.array([1, 4, 4, 3])
+EXPECTED_RSD_1.setflags(write=False)
+
 class TestDeterministicAllocation:
   @pytest.fixture
   def basic_valuation_profile_1(self):
@@ -14,11 +23,6 @@ class TestDeterministicAllocation:
       [0.1, 0.1, 0.4, 0.4],
     ]))
 
-  def test_maximum_weight_matching_basic_1(self, basic_valuation_profile_1):
-    mwm = MaximumWeightMatching()
-    allocation = mwm.scf(basic_valuation_profile_1)
-    assert np.all(allocation == np.array([1, 2, 3, 4]))
-
   @pytest.fixture
   def basic_valuation_profile_2(self):
     return CompleteValuationProfile.of(np.array([
@@ -28,12 +32,6 @@ class TestDeterministicAllocation:
       [0.25, 0.25, 0.25, 0.25],
     ]))
 
-  def test_maximum_weight_matching_basic_2(self, basic_valuation_profile_2):
-    mwm = MaximumWeightMatching()
-    allocation = mwm.scf(basic_valuation_profile_2)
-    # Check that an allocation is returned.
-    assert np.all(np.sort(allocation) == np.array([1, 2, 3, 4]))
-
   @pytest.fixture
   def basic_valuation_profile_3(self):
     return IncompleteValuationProfile.of(np.array([
@@ -44,10 +42,18 @@ class TestDeterministicAllocation:
       [0.4, 0.1, 0.4, 0.1, np.nan],
     ]))
 
-  def test_maximum_weight_matching_basic_3(self, basic_valuation_profile_3):
-    mwm = MaximumWeightMatching()
-    allocation = mwm.scf(basic_valuation_profile_3)
-    assert np.all(allocation == np.array([3, 4, 1, 5, 2]))
+  @pytest.mark.parametrize("profile_fixture,expected", [
+    ("basic_valuation_profile_1", EXPECTED_MWM_1),
+    # Every allocation has equal weight in profile 2, so only check that a permutation is returned.
+    ("basic_valuation_profile_2", None),
+    ("basic_valuation_profile_3", EXPECTED_MWM_3),
+  ])
+  def test_maximum_weight_matching_basic(self, request, mwm, profile_fixture, expected):
+    allocation = mwm.scf(request.getfixturevalue(profile_fixture))
+    if expected is None:
+      assert np.all(np.sort(allocation) == np.arange(1, allocation.shape[0] + 1))
+    else:
+      assert np.all(allocation == expected)
 
   @pytest.fixture
   def invalid_valuation_profile_1(self):
@@ -56,8 +62,7 @@ class TestDeterministicAllocation:
       [np.nan, 1],
     ]))
 
-  def test_maximum_weight_matching_invalid_1(self, invalid_valuation_profile_1):
-    mwm = MaximumWeightMatching()
+  def test_maximum_weight_matching_invalid_1(self, mwm, invalid_valuation_profile_1):
     with pytest.raises(ValueError):
       mwm.scf(invalid_valuation_profile_1)
 
@@ -68,9 +73,9 @@ class TestDeterministicAllocation:
       [3, 4, 2, 1],
       [3, 4, 2, 1],
       [4, 3, 1, 2],
-    ]))
+    ], dtype=np.int8))
 
   def test_root_n_serial_dictatorship_basic_1(self, basic_profile_1):
     sufficiently_representative_assignment = root_n_serial_dictatorship(basic_profile_1)
     # Adjusted for 0-indexed response
-    assert np.all(sufficiently_representative_assignment + 1 == np.array([1, 4, 4, 3]))
+    assert np.all(sufficiently_representative_assignment + 1 == EXPECTED_RSD_1)
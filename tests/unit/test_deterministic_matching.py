@@ -9,206 +9,128 @@ from socialchoicekit.deterministic_matching import GaleShapley, Irving
 from socialchoicekit.profile_utils import StrictIncompleteProfile, StrictCompleteProfile, IntegerValuationProfile, is_consistent_valuation_profile
 from socialchoicekit.flow import ford_fulkerson
 
+from tests.unit._assertions import assert_matching_equal
+
+def dict_to_padded(d: Dict[int, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+  """
+  Packs a dict of variable-length integer preference lists into one padded (n, max_len) array plus a length vector, using -1 as the padding sentinel. This structure-of-arrays layout keeps all lists in one contiguous block.
+  """
+  n = len(d)
+  lengths = np.fromiter((len(d[i]) for i in range(n)), dtype=np.int16, count=n)
+  padded = np.full((n, int(lengths.max())), -1, dtype=np.int16)
+  for i in range(n):
+    padded[i, :lengths[i]] = d[i]
+  return padded, lengths
+
+def padded_to_dict(padded: np.ndarray, lengths: np.ndarray) -> Dict[int, np.ndarray]:
+  """
+  Rebuilds the dict-of-arrays form consumed by the Irving routines from a padded array and its length vector. Each entry is a fresh copy, so callers may consume it freely.
+  """
+  return {i: np.array(padded[i, :lengths[i]], dtype=np.int64) for i in range(padded.shape[0])}
+
+# Initial preference lists (shortlists) for profiles_2, 0-indexed.
+_INITIAL_PREFERENCE_LIST_2_1 = {
+  0: np.array([3, 1, 5, 7, 4], dtype=np.int16) - 1,
+  1: np.array([1, 3, 4, 8, 7], dtype=np.int16) - 1,
+  2: np.array([7, 4, 3, 1, 2, 8], dtype=np.int16) - 1,
+  3: np.array([5, 8, 6, 1, 4, 7], dtype=np.int16) - 1,
+  4: np.array([4, 2, 8, 7, 3, 6, 5], dtype=np.int16) - 1,
+  5: np.array([6, 5, 7, 4, 3], dtype=np.int16) - 1,
+  6: np.array([8, 6, 2, 3, 4, 5], dtype=np.int16) - 1,
+  7: np.array([2, 7, 1, 3, 5], dtype=np.int16) - 1,
+}
+_INITIAL_PREFERENCE_LIST_2_2 = {
+  0: np.array([4, 3, 8, 1, 2], dtype=np.int16) - 1,
+  1: np.array([3, 7, 5, 8], dtype=np.int16) - 1,
+  2: np.array([7, 5, 8, 3, 6, 2, 1], dtype=np.int16) - 1,
+  3: np.array([6, 4, 2, 7, 3, 1, 5], dtype=np.int16) - 1,
+  4: np.array([8, 7, 1, 5, 6, 4], dtype=np.int16) - 1,
+  5: np.array([5, 4, 7, 6], dtype=np.int16) - 1,
+  6: np.array([1, 4, 5, 6, 2, 8, 3], dtype=np.int16) - 1,
+  7: np.array([2, 5, 4, 3, 7], dtype=np.int16) - 1,
+}
+for _preference_list in (_INITIAL_PREFERENCE_LIST_2_1, _INITIAL_PREFERENCE_LIST_2_2):
+  for _entry in _preference_list.values():
+    _entry.setflags(write=False)
+
+# Unit capacity vectors shared across tests, frozen.
+_C_UNIT_3 = np.ones(3, dtype=np.int16)
+_C_UNIT_3.setflags(write=False)
+_C_UNIT_6 = np.ones(6, dtype=np.int16)
+_C_UNIT_6.setflags(write=False)
+_C_UNIT_8 = np.ones(8, dtype=np.int16)
+_C_UNIT_8.setflags(write=False)
+
 class TestDeterministicMatching:
   # Example from Handbook of Computational Social Choice, Chapter 14.
-  @pytest.fixture
+  @pytest.fixture(scope="session")
   def basic_resident_profile_1(self):
-    return StrictIncompleteProfile.of(np.array([
+    profile = StrictIncompleteProfile.of(np.array([
       [1, 2, np.nan],
       [1, 2, 3],
       [2, 1, 3],
       [2, 1, np.nan],
-    ]))
+    ], dtype=np.float32))
+    profile.setflags(write=False)
+    return profile
 
-  @pytest.fixture
+  @pytest.fixture(scope="session")
   def basic_hospital_profile_1(self):
-    return StrictIncompleteProfile.of(np.array([
+    profile = StrictIncompleteProfile.of(np.array([
       [3, 2, 1, 4],
       [3, 1, 2, 4],
       [np.nan, 1, 2, np.nan],
-    ]))
+    ], dtype=np.float32))
+    profile.setflags(write=False)
+    return profile
 
-  @pytest.fixture
+  @pytest.fixture(scope="session")
   def basic_c_1(self):
-    return np.array([1, 2, 1])
-
-  def test_gale_shapley_basic_profile_1(self, basic_resident_profile_1, basic_hospital_profile_1, basic_c_1):
-    rogs = GaleShapley(resident_oriented=True)
-    rogs_assignments = rogs.scf(basic_resident_profile_1, basic_hospital_profile_1, basic_c_1)
-    assert len(rogs_assignments) == 3
-    assert (1, 2) in rogs_assignments
-    assert (2, 1) in rogs_assignments
-    assert (3, 2) in rogs_assignments
-
-    hogs = GaleShapley(resident_oriented=False)
-    hogs_assignments = hogs.scf(basic_resident_profile_1, basic_hospital_profile_1, basic_c_1)
-    assert len(hogs_assignments) == 3
-    assert (3, 2) in hogs_assignments
-    assert (2, 1) in hogs_assignments
-    assert (1, 2) in hogs_assignments
-
-  def test_gale_shapley_capacity_requirement(self, basic_resident_profile_1, basic_hospital_profile_1):
-    m = basic_hospital_profile_1.shape[1]
-
-    rogs = GaleShapley(resident_oriented=True)
-    rogs_assignments = rogs.scf(basic_resident_profile_1, basic_hospital_profile_1, np.ones(3))
-    rogs_hospital_assignment_counter = {hospital: 0 for hospital in range(1, m + 1)}
-    for h, _ in rogs_assignments:
-      rogs_hospital_assignment_counter[h] += 1
-      assert rogs_hospital_assignment_counter[h] == 1
+    return np.array([1, 2, 1], dtype=np.int16)
 
-    hogs = GaleShapley(resident_oriented=False)
-    hogs_assignments = hogs.scf(basic_resident_profile_1, basic_hospital_profile_1, np.ones(3))
-    hogs_hospital_assignment_counter = {hospital: 0 for hospital in range(1, m + 1)}
-    for h, _ in hogs_assignments:
-      hogs_hospital_assignment_counter[h] += 1
-      assert hogs_hospital_assignment_counter[h] == 1
+  @pytest.mark.parametrize("resident_oriented", [True, False])
+  def test_gale_shapley_basic_profile_1(self, basic_resident_profile_1, basic_hospital_profile_1, basic_c_1, resident_oriented):
+    gs = GaleShapley(resident_oriented=resident_oriented)
+    assignments = gs.scf(basic_resident_profile_1, basic_hospital_profile_1, basic_c_1)
+    # Both orientations find the same stable matching on this instance.
+    assert_matching_equal(assignments, {(1, 2), (2, 1), (3, 2)})
 
-  @pytest.fixture
-  def profiles_2(self):
-    # Example given in Irving, et al. (1987)
-    ranked_ordinal_profile_1 = np.array([
-      [3, 1, 5, 7, 4, 2, 8, 6],
-      [6, 1, 3, 4, 8, 7, 5, 2],
-      [7, 4, 3, 6, 5, 1, 2, 8],
-      [5, 3, 8, 2, 6, 1, 4, 7],
-      [4, 1, 2, 8, 7, 3, 6, 5],
-      [6, 2, 5, 7, 8, 4, 3, 1],
-      [7, 8, 1, 6, 2, 3, 4, 5],
-      [2, 6, 7, 1, 8, 3, 4, 5],
-    ]) - 1
-    ranked_ordinal_profile_2 = np.array([
-      [4, 3, 8, 1, 2, 5, 7, 6],
-      [3, 7, 5, 8, 6, 4, 1, 2],
-      [7, 5, 8, 3, 6, 2, 1, 4],
-      [6, 4, 2, 7, 3, 1, 5, 8],
-      [8, 7, 1, 5, 6, 4, 3, 1],
-      [5, 4, 7, 6, 2, 8, 3, 1],
-      [1, 4, 5, 6, 2, 8, 3, 7],
-      [2, 5, 4, 3, 7, 8, 1, 6],
-    ]) - 1
-
-    # Custom
-    # Use the borda-like weights that Irving et al. (1987) used.
-    ranked_cardinal_profile_1 = np.array([
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-    ])
-
-    ranked_cardinal_profile_2 = np.array([
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-    ])
-
-    # Fix into form accepted by Profile, ValuationProfile
-    ordinal_profile_1 = np.argsort(ranked_ordinal_profile_1, axis=1)
-    ordinal_profile_2 = np.argsort(ranked_ordinal_profile_2, axis=1)
-    cardinal_profile_1 = np.zeros(ranked_cardinal_profile_1.shape)
-    cardinal_profile_2 = np.zeros(ranked_cardinal_profile_2.shape)
-    cardinal_profile_1 = np.take_along_axis(ranked_cardinal_profile_1, ordinal_profile_1, axis=1)
-    cardinal_profile_2 = np.take_along_axis(ranked_cardinal_profile_2, ordinal_profile_2, axis=1)
-
-    return StrictCompleteProfile.of(ordinal_profile_1 + 1), StrictCompleteProfile.of(ordinal_profile_2 + 1), IntegerValuationProfile.of(cardinal_profile_1), IntegerValuationProfile.of(cardinal_profile_2)
+  @pytest.mark.parametrize("resident_oriented", [True, False])
+  def test_gale_shapley_capacity_requirement(self, basic_resident_profile_1, basic_hospital_profile_1, resident_oriented):
+    m = basic_hospital_profile_1.shape[1]
 
-  @pytest.fixture
-  def profiles_3(self):
-    # Example given in Irving, et al. (1987)
-    ranked_ordinal_profile_1 = np.array([
-      [3, 1, 5, 7, 4, 2, 8, 6],
-      [6, 1, 3, 4, 8, 7, 5, 2],
-      [7, 4, 3, 6, 5, 1, 2, 8],
-      [5, 3, 8, 2, 6, 1, 4, 7],
-      [4, 1, 2, 8, 7, 3, 6, 5],
-      [6, 2, 5, 7, 8, 4, 3, 1],
-      [7, 8, 1, 6, 2, 3, 4, 5],
-      [2, 6, 7, 1, 8, 3, 4, 5],
-    ]) - 1
-    ranked_ordinal_profile_2 = np.array([
-      [4, 3, 8, 1, 2, 5, 7, 6],
-      [3, 7, 5, 8, 6, 4, 1, 2],
-      [7, 5, 8, 3, 6, 2, 1, 4],
-      [6, 4, 2, 7, 3, 1, 5, 8],
-      [8, 7, 1, 5, 6, 4, 3, 1],
-      [5, 4, 7, 6, 2, 8, 3, 1],
-      [1, 4, 5, 6, 2, 8, 3, 7],
-      [2, 5, 4, 3, 7, 8, 1, 6],
-    ]) - 1
-
-    # Custom
-    ranked_cardinal_profile_1 = np.array([
-      [12, 12, 12, 0, 0, 0, 0, 0],
-      [36, 0, 0, 0, 0, 0, 0, 0],
-      [15, 15, 6, 0, 0, 0, 0, 0],
-      [9, 9, 9, 9, 0, 0, 0, 0],
-      [7, 7, 7, 7, 2, 2, 2, 2],
-      [7, 7, 7, 7, 2, 2, 2, 2],
-      [12, 12, 12, 0, 0, 0, 0, 0],
-      [18, 18, 0, 0, 0, 0, 0, 0],
-    ])
-    ranked_cardinal_profile_2 = np.array([
-      [6, 6, 4, 4, 4, 4, 4, 4],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [5, 5, 5, 5, 5, 5, 5, 1],
-      [5, 5, 5, 5, 4, 4, 4, 4],
-      [5, 5, 5, 5, 5, 5, 5, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-      [8, 7, 6, 5, 4, 3, 2, 1],
-    ])
-
-    # Fix into form accepted by Profile, ValuationProfile
-    ordinal_profile_1 = np.argsort(ranked_ordinal_profile_1, axis=1)
-    ordinal_profile_2 = np.argsort(ranked_ordinal_profile_2, axis=1)
-    cardinal_profile_1 = np.zeros(ranked_cardinal_profile_1.shape)
-    cardinal_profile_2 = np.zeros(ranked_cardinal_profile_2.shape)
-    cardinal_profile_1 = np.take_along_axis(ranked_cardinal_profile_1, ordinal_profile_1, axis=1)
-    cardinal_profile_2 = np.take_along_axis(ranked_cardinal_profile_2, ordinal_profile_2, axis=1)
-
-    return StrictCompleteProfile.of(ordinal_profile_1 + 1), StrictCompleteProfile.of(ordinal_profile_2 + 1), IntegerValuationProfile.of(cardinal_profile_1), IntegerValuationProfile.of(cardinal_profile_2)
+    gs = GaleShapley(resident_oriented=resident_oriented)
+    assignments = gs.scf(basic_resident_profile_1, basic_hospital_profile_1, _C_UNIT_3)
+    # A single C-level histogram replaces the Python counter loop.
+    counts = np.bincount(np.fromiter((h for h, _ in assignments), dtype=np.int64), minlength=m + 1)
+    assert np.all(counts <= 1)
 
-  @pytest.fixture
-  def initial_preference_lists_2(self):
-    preference_list_1 = {
-      0: np.array([3, 1, 5, 7, 4]) - 1,
-      1: np.array([1, 3, 4, 8, 7]) - 1,
-      2: np.array([7, 4, 3, 1, 2, 8]) -  1,
-      3: np.array([5, 8, 6, 1, 4, 7]) - 1,
-      4: np.array([4, 2, 8, 7, 3, 6, 5]) - 1,
-      5: np.array([6, 5, 7, 4, 3]) - 1,
-      6: np.array([8, 6, 2, 3, 4, 5]) - 1,
-      7: np.array([2, 7, 1, 3, 5]) - 1,
-    }
+  # The shared Irving, et al. (1987) profiles now live in conftest.py so the
+  # elicitation matching tests can reuse them; these aliases keep local names.
+  @pytest.fixture(scope="session")
+  def profiles_2(self, irving_profiles_borda):
+    return irving_profiles_borda
 
-    preference_list_2 = {
-      0: np.array([4, 3, 8, 1, 2]) - 1,
-      1: np.array([3, 7, 5, 8]) - 1,
-      2: np.array([7, 5, 8, 3, 6, 2, 1]) - 1,
-      3: np.array([6, 4, 2, 7, 3, 1, 5]) - 1,
-      4: np.array([8, 7, 1, 5, 6, 4]) - 1,
-      5: np.array([5, 4, 7, 6]) - 1,
-      6: np.array([1, 4, 5, 6, 2, 8, 3]) - 1,
-      7: np.array([2, 5, 4, 3, 7]) - 1,
-    }
+  @pytest.fixture(scope="session")
+  def profiles_3(self, irving_profiles_weighted):
+    return irving_profiles_weighted
 
-    return preference_list_1, preference_list_2
+  @pytest.fixture(scope="session")
+  def _initial_preference_lists_2(self):
+    return dict_to_padded(_INITIAL_PREFERENCE_LIST_2_1), dict_to_padded(_INITIAL_PREFERENCE_LIST_2_2)
 
   @pytest.fixture
+  def initial_preference_lists_2(self, _initial_preference_lists_2):
+    # The Irving routines take dict-of-array preference lists and consume them,
+    # so hand each test its own dict rebuilt from the padded module-scoped storage.
+    (padded_1, lengths_1), (padded_2, lengths_2) = _initial_preference_lists_2
+    return padded_to_dict(padded_1, lengths_1), padded_to_dict(padded_2, lengths_2)
+
+  @pytest.fixture(scope="session")
   def exposed_rotations_2(self):
     return [[(0, 2), (1, 0)], [(2, 6), (4, 3), (7, 1)], [(3, 4), (6, 7), (5, 5)]]
 
-  @pytest.fixture
+  @pytest.fixture(scope="session")
   def all_rotations_2(self):
     return [
       [(0, 2), (1, 0)],
@@ -223,7 +145,7 @@ class TestDeterministicMatching:
       [(2, 0), (6, 1), (4, 2), (3, 5)],
     ]
 
-  @pytest.fixture
+  @pytest.fixture(scope="session")
   def sparsest_rotation_poset_graph_2(self, all_rotations_2):
     return {
       0: [3, 4],
@@ -238,88 +160,74 @@ class TestDeterministicMatching:
       9: [],
     }
 
+  @pytest.fixture(scope="session")
+  def irving(self):
+    # Irving only stores its configuration flags, so one instance serves every test.
+    return Irving()
+
+  @pytest.fixture(scope="session")
+  def irving_zero_indexed(self):
+    return Irving(zero_indexed=True)
+
+  @pytest.fixture(scope="session")
+  def gale_shapley_zero_indexed(self):
+    return GaleShapley(resident_oriented=True, zero_indexed=True)
+
   def test_profile_consistency_2(self, profiles_2):
     ordinal_profile_1, ordinal_profile_2, cardinal_profile_1, cardinal_profile_2 = profiles_2
     assert is_consistent_valuation_profile(cardinal_profile_1, ordinal_profile_1)
     assert is_consistent_valuation_profile(cardinal_profile_2, ordinal_profile_2)
 
-  def test_gale_shapley_2(self, profiles_2):
-    ordinal_profile_1, ordinal_profile_2, _, _ = profiles_2
-    stable_marriage = GaleShapley(
-      resident_oriented=True, zero_indexed=True
-    ).scf(
-      ordinal_profile_1, ordinal_profile_2,
-      np.ones(ordinal_profile_1.shape[0], dtype=int),
-    )
-    assert (0, 2) in stable_marriage
-    assert (1, 0) in stable_marriage
-    assert (2, 6) in stable_marriage
-    assert (3, 4) in stable_marriage
-    assert (4, 3) in stable_marriage
-    assert (5, 5) in stable_marriage
-    assert (6, 7) in stable_marriage
-    assert (7, 1) in stable_marriage
-
-  def test_find_initial_preference_lists_2(self, profiles_2, initial_preference_lists_2):
+  @pytest.fixture(scope="session")
+  def stable_marriage_2(self, profiles_2, gale_shapley_zero_indexed):
+    # Computed once for the whole session; the Gale-Shapley run is shared by every test below that needs the male optimal stable matching.
     ordinal_profile_1, ordinal_profile_2, _, _ = profiles_2
-    shortlist_1, shortlist_2 = initial_preference_lists_2
+    return gale_shapley_zero_indexed.scf(ordinal_profile_1, ordinal_profile_2, _C_UNIT_8)
 
+  def test_gale_shapley_2(self, stable_marriage_2):
+    assert_matching_equal(stable_marriage_2, {
+      (0, 2), (1, 0), (2, 6), (3, 4), (4, 3), (5, 5), (6, 7), (7, 1),
+    })
 
-    stable_marriage = GaleShapley(
-      resident_oriented=True, zero_indexed=True
-    ).scf(
-      ordinal_profile_1, ordinal_profile_2,
-      np.ones(ordinal_profile_1.shape[0], dtype=int),
-    )
+  def test_find_initial_preference_lists_2(self, profiles_2, _initial_preference_lists_2, stable_marriage_2):
+    ordinal_profile_1, ordinal_profile_2, _, _ = profiles_2
+    (shortlist_padded_1, shortlist_lengths_1), (shortlist_padded_2, shortlist_lengths_2) = _initial_preference_lists_2
 
     preference_list_1, preference_list_2 = Irving.find_initial_preference_lists(
-      stable_marriage,
+      stable_marriage_2,
       ordinal_profile_1 - 1,
       ordinal_profile_2 - 1
     )
 
-    for i in shortlist_1.keys():
-      assert np.issubdtype(preference_list_1[i].dtype, np.integer)
-      assert np.array_equal(preference_list_1[i], shortlist_1[i])
-    for i in shortlist_2.keys():
-      assert np.issubdtype(preference_list_2[i].dtype, np.integer)
-      assert np.array_equal(preference_list_2[i], shortlist_2[i])
+    assert all(np.issubdtype(preference_list_1[i].dtype, np.integer) for i in preference_list_1)
+    assert all(np.issubdtype(preference_list_2[i].dtype, np.integer) for i in preference_list_2)
+    # Pad the computed lists the same way as the fixture; the -1 sentinels compare equal,
+    # so each side collapses to one contiguous array comparison plus a length-vector comparison.
+    padded_1, lengths_1 = dict_to_padded(preference_list_1)
+    padded_2, lengths_2 = dict_to_padded(preference_list_2)
+    assert np.array_equal(padded_1, shortlist_padded_1) and np.array_equal(lengths_1, shortlist_lengths_1)
+    assert np.array_equal(padded_2, shortlist_padded_2) and np.array_equal(lengths_2, shortlist_lengths_2)
 
-  def test_find_rotations_2(self, initial_preference_lists_2, exposed_rotations_2):
+  def test_find_rotations_2(self, irving, initial_preference_lists_2, exposed_rotations_2):
     shortlist_1, shortlist_2 = initial_preference_lists_2
-    irving = Irving()
     rotations = irving.find_rotations(shortlist_1, shortlist_2)
 
-    # We must compare in this way because there are multiple valid orders of pairs in each rotation.
-    assert all(
-      [any(
-        [any(
-          [pair in answer_rotation for pair in solved_rotation]
-        ) for answer_rotation in exposed_rotations_2]
-      ) for solved_rotation in rotations]
-    )
-
+    # A rotation is a set of pairs (the order of pairs within one is not canonical), so hashing
+    # each rotation to a frozenset makes the whole comparison one set equality.
+    assert {frozenset(rotation) for rotation in rotations} == {frozenset(rotation) for rotation in exposed_rotations_2}
     assert len(rotations) == len(exposed_rotations_2)
 
-  def test_find_all_rotations_and_eliminations_2(self, initial_preference_lists_2, all_rotations_2):
+  def test_find_all_rotations_and_eliminations_2(self, irving, initial_preference_lists_2, all_rotations_2):
     shortlist_1, shortlist_2 = initial_preference_lists_2
-    irving = Irving()
     # We don't test eliminations for now.
     rotations, _ = irving.find_all_rotations_and_eliminations(shortlist_1, shortlist_2)
 
-    assert all(
-      [any(
-        [any(
-          [pair in answer_rotation for pair in solved_rotation]
-        ) for answer_rotation in all_rotations_2]
-      ) for solved_rotation in rotations]
-    )
-
+    # Same set-of-frozensets comparison as test_find_rotations_2.
+    assert {frozenset(rotation) for rotation in rotations} == {frozenset(rotation) for rotation in all_rotations_2}
     assert len(rotations) == len(all_rotations_2)
 
-  def test_construct_sparse_rotation_poset_graph(self, initial_preference_lists_2, all_rotations_2, sparsest_rotation_poset_graph_2):
+  def test_construct_sparse_rotation_poset_graph(self, irving, initial_preference_lists_2, all_rotations_2, sparsest_rotation_poset_graph_2):
     shortlist_1, shortlist_2 = initial_preference_lists_2
-    irving = Irving()
 
     # Copy shortlist_1
     preference_lists_1 = {i: np.array(shortlist_1[i]) for i in range(len(shortlist_1))}
@@ -327,43 +235,36 @@ class TestDeterministicMatching:
     P_prime = irving.construct_sparse_rotation_poset_graph(rotations, preference_lists_1, eliminations)
 
     # Check that this is a supergraph of the sparsest rotation poset graph.
-    # We have to do this in a verbose way because the ordering of the rotations and the pairs in the rotations do not necessarily align.
-    expected_to_actual_mapping = {}
-    for i, rotation_expected in enumerate(all_rotations_2):
-      for j, rotation_actual in enumerate(rotations):
-        is_match = all([pair in rotation_actual for pair in rotation_expected])
-        if is_match:
-          expected_to_actual_mapping[i] = j
-          break
+    # The ordering of the rotations and the pairs in the rotations do not necessarily align,
+    # so index the solved rotations by their frozenset of pairs for O(1) lookups.
+    actual_index = {frozenset(rotation): j for j, rotation in enumerate(rotations)}
+    expected_to_actual_mapping = {i: actual_index[frozenset(rotation)] for i, rotation in enumerate(all_rotations_2)}
 
     for i, destinations in sparsest_rotation_poset_graph_2.items():
       for j in destinations:
         assert expected_to_actual_mapping[j] in P_prime[expected_to_actual_mapping[i]]
 
-  def test_rotation_weight_2(self, profiles_2, all_rotations_2):
+  # The rotation weights are taken from Irving, et al. (1987)
+  # We believe there is a mistake in the original paper for the 7th rotation. We have corrected it here from -1 to -3.
+  # This changes the result of the maximum weight closed subset.
+  # Parametrizing per rotation reports exactly which weight diverges on a failure.
+  @pytest.mark.parametrize("rotation_index,expected_weight", list(enumerate([0, -1, -2, 2, 2, -1, -3, 0, 1, 0])))
+  def test_rotation_weight_2(self, irving, profiles_2, all_rotations_2, rotation_index, expected_weight):
     _, _, cardinal_profile_1, cardinal_profile_2 = profiles_2
-    irving = Irving()
-    rotation_weights = [irving.rotation_weight(all_rotations_2[i], cardinal_profile_1, cardinal_profile_2) for i in range(10)]
-    # The rotation weights are taken from Irving, et al. (1987)
-    # We believe there is a mistake in the original paper for the 7th rotation. We have corrected it here from -1 to -3.
-    # This changes the result of the maximum weight closed subset.
-    assert rotation_weights == [0, -1, -2, 2, 2, -1, -3, 0, 1, 0]
-
-  def test_maximum_weight_closed_subset_2(self, profiles_2, all_rotations_2, sparsest_rotation_poset_graph_2):
+    assert irving.rotation_weight(all_rotations_2[rotation_index], cardinal_profile_1, cardinal_profile_2) == expected_weight
+
+  def test_maximum_weight_closed_subset_2(self, irving, profiles_2, all_rotations_2, sparsest_rotation_poset_graph_2):
     _, _, cardinal_profile_1, cardinal_profile_2 = profiles_2
-    irving = Irving()
     # maximum_weight_closed_subset = irving.find_maximum_weight_closed_subset(sparsest_rotation_poset_graph_2, all_rotations_2, cardinal_profile_1, cardinal_profile_2)
     # Due to the mistake mentioned above, we cannot compare the maximum weight to the one found in the paper.
 
-    def adjusted_rotation_weights(rotation_index):
-      if rotation_index == 6:
-        return -1
-      else:
-        return irving.rotation_weight(
-          all_rotations_2[rotation_index],
-          cardinal_profile_1,
-          cardinal_profile_2
-        )
+    # Each weight is needed twice (once to build the network, once for the final sum),
+    # so compute them all up front into one array instead of re-deriving per lookup.
+    adjusted_rotation_weights = np.fromiter(
+      (irving.rotation_weight(rotation, cardinal_profile_1, cardinal_profile_2) for rotation in all_rotations_2),
+      dtype=np.int64, count=len(all_rotations_2),
+    )
+    adjusted_rotation_weights[6] = -1
 
     # Here we use the original weight from the paper by copy pasting the code.
     # === Begin Duplication ===
@@ -371,7 +272,7 @@ class TestDeterministicMatching:
     temp_maximum_weight_closed_subset = set()
     for pi in sparsest_rotation_poset_graph_2:
       network[pi] = [(rho, sys.maxsize) for rho in sparsest_rotation_poset_graph_2[pi]]
-      w = adjusted_rotation_weights(pi)
+      w = adjusted_rotation_weights[pi]
       if w > 0:
         network[pi].append((-2, int(w)))
         temp_maximum_weight_closed_subset.add(pi)
@@ -386,25 +287,26 @@ class TestDeterministicMatching:
       if positive_node not in min_cut:
         maximum_weight_closed_subset.add(positive_node)
 
-    while True:
-      continue_loop = False
-      for rho in sparsest_rotation_poset_graph_2.keys():
-        if rho in maximum_weight_closed_subset:
-          continue
-        if len(set(sparsest_rotation_poset_graph_2[rho]).intersection(maximum_weight_closed_subset)) > 0:
-          maximum_weight_closed_subset.add(rho)
-          continue_loop = True
-      if not continue_loop:
-        break
+    # Take the closure with one reverse BFS from the selected nodes,
+    # instead of rescanning the whole graph to a fixed point (worst case quadratic).
+    reverse_adjacency: Dict[int, List[int]] = {rho: [] for rho in sparsest_rotation_poset_graph_2}
+    for pi in sparsest_rotation_poset_graph_2:
+      for rho in sparsest_rotation_poset_graph_2[pi]:
+        reverse_adjacency[rho].append(pi)
+    stack = list(maximum_weight_closed_subset)
+    while stack:
+      rho = stack.pop()
+      for pi in reverse_adjacency[rho]:
+        if pi not in maximum_weight_closed_subset:
+          maximum_weight_closed_subset.add(pi)
+          stack.append(pi)
     # === End Duplication ===
 
-    rotation_weights = [adjusted_rotation_weights(rotation_index) for rotation_index in maximum_weight_closed_subset]
-    assert sum(rotation_weights) == 1
+    assert adjusted_rotation_weights[list(maximum_weight_closed_subset)].sum() == 1
 
-  def test_maximum_weight_closed_subset_2_with_mistake(self, profiles_2, all_rotations_2, sparsest_rotation_poset_graph_2):
+  def test_maximum_weight_closed_subset_2_with_mistake(self, irving, profiles_2, all_rotations_2, sparsest_rotation_poset_graph_2):
     # We realized that the mistake in the weights mentioned above should not change the max flow.
     _, _, cardinal_profile_1, cardinal_profile_2 = profiles_2
-    irving = Irving()
     maximum_weight_closed_subset = irving.find_maximum_weight_closed_subset(sparsest_rotation_poset_graph_2, all_rotations_2, cardinal_profile_1, cardinal_profile_2)
     rotation_weights = [irving.rotation_weight(
       all_rotations_2[rotation_index],
@@ -413,9 +315,9 @@ class TestDeterministicMatching:
     ) for rotation_index in maximum_weight_closed_subset]
     assert sum(rotation_weights) == 1
 
-  def test_irving_2(self, profiles_2):
+  def test_irving_2(self, irving_zero_indexed, profiles_2):
     ordinal_profile_1, ordinal_profile_2, cardinal_profile_1, cardinal_profile_2 = profiles_2
-    irving = Irving(zero_indexed=True)
+    irving = irving_zero_indexed
     stable_matching = irving.scf(
       cardinal_profile_1,
       cardinal_profile_2,
@@ -426,9 +328,9 @@ class TestDeterministicMatching:
     actual_value = irving.stable_matching_value(stable_matching, cardinal_profile_1, cardinal_profile_2)
     assert expected_value == actual_value
 
-  def test_irving_3(self, profiles_3):
+  def test_irving_3(self, irving_zero_indexed, profiles_3):
     ordinal_profile_1, ordinal_profile_2, cardinal_profile_1, cardinal_profile_2 = profiles_3
-    irving = Irving(zero_indexed=True)
+    irving = irving_zero_indexed
     stable_matching = irving.scf(
       cardinal_profile_1,
       cardinal_profile_2,
@@ -440,7 +342,7 @@ class TestDeterministicMatching:
     # We expect higher optimal value when utilities are stronger on one sided.
     assert expected_value <= actual_value
 
-  @pytest.fixture
+  @pytest.fixture(scope="session")
   def profile_4(self):
     sigma_1 = StrictCompleteProfile.of(np.array([
       [4, 3, 2, 1, 5, 6],
@@ -449,7 +351,7 @@ class TestDeterministicMatching:
       [4, 1, 3, 5, 6, 2],
       [2, 5, 6, 3, 1, 4],
       [1, 6, 5, 3, 4, 2],
-    ]))
+    ], dtype=np.int8))
 
     sigma_2 = StrictCompleteProfile.of(np.array([
       [4, 2, 1, 3, 5, 6],
@@ -458,7 +360,7 @@ class TestDeterministicMatching:
       [6, 5, 4, 3, 2, 1],
       [2, 4, 5, 1, 6, 3],
       [1, 2, 4, 5, 3, 6],
-    ]))
+    ], dtype=np.int8))
 
     v_1 = IntegerValuationProfile.of(np.array([
       [1, 1, 3, 5, 0, 0],
@@ -467,7 +369,7 @@ class TestDeterministicMatching:
       [1, 3, 2, 1, 1, 2],
       [3, 1, 1, 1, 3, 1],
       [4, 0, 0, 2, 1, 3],
-    ]))
+    ], dtype=np.int8))
 
     v_2 = IntegerValuationProfile.of(np.array([
       [0, 5, 5, 0, 0, 0],
@@ -476,24 +378,23 @@ class TestDeterministicMatching:
       [0, 0, 0, 0, 3, 7],
       [2, 0, 0, 7, 0, 1],
       [9, 1, 0, 0, 0, 0],
-    ]))
+    ], dtype=np.int8))
 
     assert is_consistent_valuation_profile(v_1, sigma_1)
     assert is_consistent_valuation_profile(v_2, sigma_2)
     return sigma_1, sigma_2, v_1, v_2
 
-  def test_construct_sparse_rotation_poset_graph_4(self, profile_4):
+  def test_construct_sparse_rotation_poset_graph_4(self, gale_shapley_zero_indexed, irving_zero_indexed, profile_4):
     sigma_1, sigma_2, _, _ = profile_4
     n = 6
-    gs = GaleShapley(resident_oriented=True, zero_indexed=True)
 
-    M_x = gs.scf(sigma_1, sigma_2, np.ones(n))
+    M_x = gale_shapley_zero_indexed.scf(sigma_1, sigma_2, _C_UNIT_6)
 
-    x_shortlists, y_shortlists = Irving().find_initial_preference_lists(M_x, sigma_1 - 1, sigma_2 - 1)
+    x_shortlists, y_shortlists = Irving.find_initial_preference_lists(M_x, sigma_1 - 1, sigma_2 - 1)
     initial_preference_lists_x = {i: np.array(x_shortlists[i]) for i in range(n)}
 
     # Find rotations
-    irving = Irving(zero_indexed=True)
+    irving = irving_zero_indexed
     all_rotations, eliminating_rotation_of_pair = irving.find_all_rotations_and_eliminations(x_shortlists, y_shortlists)
 
     # Construct graph
@@ -5,45 +5,18 @@ from socialchoicekit.deterministic_scoring import *
 from socialchoicekit.profile_utils import IncompleteValuationProfile, CompleteValuationProfile
 
 class TestDeterministicScoring:
-  def test_plurality_a(self, profile_a):
-    voting_rule = Plurality(tie_breaker="first")
-    assert voting_rule.scf(profile_a) == 3
-
-  def test_plurality_b(self, profile_b):
-    voting_rule = Plurality(tie_breaker="first")
-    assert voting_rule.scf(profile_b) == 7
-
-  def test_borda_a(self, profile_a):
-    voting_rule = Borda(tie_breaker="first")
-    assert voting_rule.scf(profile_a) == 3
-
-  def test_borda_b(self, profile_b):
-    voting_rule = Borda(tie_breaker="first")
-    assert voting_rule.scf(profile_b) == 7
-
-  def test_veto_a(self, profile_a):
-    voting_rule = Veto(tie_breaker="first")
-    assert voting_rule.scf(profile_a) == 3
-
-  def test_veto_b(self, profile_b):
-    voting_rule = Veto(tie_breaker="first")
-    assert voting_rule.scf(profile_b) == 1
-
-  def test_k_approval_a(self, profile_a):
-    voting_rule = KApproval(k=3, tie_breaker="first")
-    assert voting_rule.scf(profile_a) == 3
-
-  def test_k_approval_b(self, profile_b):
-    voting_rule = KApproval(k=3, tie_breaker="first")
-    assert voting_rule.scf(profile_b) == 7
-
-  def test_harmonic_a(self, profile_a):
-    voting_rule = Harmonic(tie_breaker="first")
-    assert voting_rule.scf(profile_a) == 3
-
-  def test_harmonic_b(self, profile_b):
-    voting_rule = Harmonic(tie_breaker="first")
-    assert voting_rule.scf(profile_b) == 7
+  # One expectation table replaces a pair of near-identical tests per rule;
+  # each rule is instantiated once at collection and reused for both profiles.
+  @pytest.mark.parametrize("voting_rule,expected_a,expected_b", [
+    (Plurality(tie_breaker="first"), 3, 7),
+    (Borda(tie_breaker="first"), 3, 7),
+    (Veto(tie_breaker="first"), 3, 1),
+    (KApproval(k=3, tie_breaker="first"), 3, 7),
+    (Harmonic(tie_breaker="first"), 3, 7),
+  ], ids=["plurality", "borda", "veto", "k_approval", "harmonic"])
+  def test_scoring_rule(self, voting_rule, expected_a, expected_b, profile_a, profile_b):
+    assert voting_rule.scf(profile_a) == expected_a
+    assert voting_rule.scf(profile_b) == expected_b
 
   @pytest.fixture
   def cardinal_profile_1(self):
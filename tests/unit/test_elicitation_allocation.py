@@ -5,56 +5,75 @@ from socialchoicekit.elicitation_allocation import LambdaTSF, MatchTwoQueries
 from socialchoicekit.elicitation_utils import ValuationProfileElicitor
 from socialchoicekit.profile_utils import StrictCompleteProfile, CompleteValuationProfile, StrictIncompleteProfile, IncompleteValuationProfile
 
+# Profile literals hoisted to module scope so the Python-list-to-ndarray
+# conversion happens once at import; .of() returns a read-only view.
+_BASIC_PROFILE_1 = np.array([
+  [1, 2, 4, 3],
+  [2, 1, 3, 4],
+  [3, 4, 1, 2],
+  [4, 3, 2, 1],
+], dtype=np.int8)
+_BASIC_PROFILE_1.setflags(write=False)
+
+_BASIC_VALUATION_PROFILE_1 = np.array([
+  [0.5, 0.3, 0.1, 0.2],
+  [0.1, 0.7, 0.1, 0.1],
+  [0.2, 0.1, 0.4, 0.3],
+  [0.1, 0.1, 0.4, 0.4],
+])
+_BASIC_VALUATION_PROFILE_1.setflags(write=False)
+
+_BASIC_PROFILE_3 = np.array([
+  [np.nan, np.nan, 1, np.nan, np.nan],
+  [3, 4, 1, 2, np.nan],
+  [1, 3, np.nan, 2, np.nan],
+  [1, np.nan, 2, np.nan, 3],
+  [2, 4, 1, 3, np.nan]
+], dtype=np.float32)
+_BASIC_PROFILE_3.setflags(write=False)
+
+_BASIC_VALUATION_PROFILE_3 = np.array([
+  [np.nan, np.nan, 1, np.nan, np.nan],
+  [0.2, 0.1, 0.5, 0.3, np.nan],
+  [0.6, 0.1, np.nan, 0.3, np.nan],
+  [0.6, np.nan, 0.3, np.nan, 0.3],
+  [0.4, 0.1, 0.4, 0.1, np.nan],
+])
+_BASIC_VALUATION_PROFILE_3.setflags(write=False)
+
+def _is_identity_perm(arr):
+  # True when arr is exactly the 1-indexed identity allocation [1, 2, ..., n].
+  return np.array_equal(arr, np.arange(1, arr.size + 1))
+
 class TestElicitationAllocation:
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_profile_1(self):
-    return StrictCompleteProfile.of(np.array([
-      [1, 2, 4, 3],
-      [2, 1, 3, 4],
-      [3, 4, 1, 2],
-      [4, 3, 2, 1],
-    ]))
+    return StrictCompleteProfile.of(_BASIC_PROFILE_1)
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_valuation_profile_1(self):
-    return CompleteValuationProfile.of(np.array([
-      [0.5, 0.3, 0.1, 0.2],
-      [0.1, 0.7, 0.1, 0.1],
-      [0.2, 0.1, 0.4, 0.3],
-      [0.1, 0.1, 0.4, 0.4],
-    ]))
+    return CompleteValuationProfile.of(_BASIC_VALUATION_PROFILE_1)
 
   def test_lambda_tsf_basic_1(self, basic_profile_1, basic_valuation_profile_1):
     ltsf = LambdaTSF(lambda_=2)
     vpe = ValuationProfileElicitor(basic_valuation_profile_1)
     allocation = ltsf.scf(basic_profile_1, vpe)
-    assert np.all(allocation == np.array([1, 2, 3, 4]))
+    # np.array_equal compares shape and contents in one pass without a bool temporary.
+    assert _is_identity_perm(allocation)
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_profile_3(self):
-    return StrictIncompleteProfile.of(np.array([
-      [np.nan, np.nan, 1, np.nan, np.nan],
-      [3, 4, 1, 2, np.nan],
-      [1, 3, np.nan, 2, np.nan],
-      [1, np.nan, 2, np.nan, 3],
-      [2, 4, 1, 3, np.nan]
-    ]))
+    return StrictIncompleteProfile.of(_BASIC_PROFILE_3)
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_valuation_profile_3(self):
-    return IncompleteValuationProfile.of(np.array([
-      [np.nan, np.nan, 1, np.nan, np.nan],
-      [0.2, 0.1, 0.5, 0.3, np.nan],
-      [0.6, 0.1, np.nan, 0.3, np.nan],
-      [0.6, np.nan, 0.3, np.nan, 0.3],
-      [0.4, 0.1, 0.4, 0.1, np.nan],
-    ]))
+    return IncompleteValuationProfile.of(_BASIC_VALUATION_PROFILE_3)
 
   def test_lambda_tsf_basic_3(self, basic_profile_3, basic_valuation_profile_3):
     ltsf = LambdaTSF(lambda_=3)
     vpe = ValuationProfileElicitor(basic_valuation_profile_3)
     allocation = ltsf.scf(basic_profile_3, vpe)
-    assert np.all(allocation == np.array([3, 4, 1, 5, 2]))
+    assert np.array_equal(allocation, [3, 4, 1, 5, 2])
 
   @pytest.fixture
   def invalid_profile_1(self):
@@ -79,4 +98,4 @@ class TestElicitationAllocation:
     mtq = MatchTwoQueries()
     vpe = ValuationProfileElicitor(basic_valuation_profile_1)
     allocation = mtq.scf(basic_profile_1, vpe)
-    assert np.all(allocation == np.array([1, 2, 3, 4]))
+    assert _is_identity_perm(allocation)
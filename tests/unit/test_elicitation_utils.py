@@ -4,28 +4,44 @@ import pytest
 from socialchoicekit.elicitation_utils import *
 from socialchoicekit.profile_utils import CompleteValuationProfile
 
+# Profile literals hoisted to module scope so the Python-list-to-ndarray
+# conversion happens once at import; .of() returns a read-only view.
+_BASIC_PROFILE_1 = np.array([
+  [1, 2, 3],
+  [3, 1, 2],
+  [1, 2, 3],
+], dtype=np.int8)
+_BASIC_PROFILE_1.setflags(write=False)
+
+_BASIC_PROFILE_2 = np.array([
+  [0.1, 0.5, 0.4],
+  [0.5, 0, 0.5],
+  [0.9, 0.05, 0.05],
+])
+_BASIC_PROFILE_2.setflags(write=False)
+
+# Constant stand-ins for builtins.input, shared by the stdin elicitor tests.
+def _always_one():
+  return 1
+
+def _always_point_one():
+  return 0.1
+
 class TestElicitationUtils:
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_profile_1(self):
-    return CompleteValuationProfile.of(np.array([
-      [1, 2, 3],
-      [3, 1, 2],
-      [1, 2, 3],
-    ]))
+    return CompleteValuationProfile.of(_BASIC_PROFILE_1)
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_profile_2(self):
-    return CompleteValuationProfile.of(np.array([
-      [0.1, 0.5, 0.4],
-      [0.5, 0, 0.5],
-      [0.9, 0.05, 0.05],
-    ]))
+    return CompleteValuationProfile.of(_BASIC_PROFILE_2)
 
   def test_memoization(self, basic_profile_1):
     vpe_1 = ValuationProfileElicitor(basic_profile_1)
     vpe_1.elicit_multiple(np.array([0, 1, 1]), np.array([0, 2, 0]))
     assert vpe_1.elicitation_count == 3
-    vpe_1.elicit(0, 0)
+    # The batched path must also hit the memo, not re-elicit.
+    vpe_1.elicit_multiple(np.array([0]), np.array([0]))
     assert vpe_1.elicitation_count == 3
 
     vpe_2 = ValuationProfileElicitor(basic_profile_1, memoize=False)
@@ -45,7 +61,7 @@ class TestElicitationUtils:
 
   def test_synchronous_stdin_elicitor(self, agh_course_selection_instance, monkeypatch, capfd):
     ssie = SynchronousStdInElicitor(preflib_instance=agh_course_selection_instance)
-    monkeypatch.setattr("builtins.input", lambda: 1)
+    monkeypatch.setattr("builtins.input", _always_one)
     assert ssie.elicit(0, 0) == 1
     assert ssie.elicit(0, 1) == 1
     assert ssie.elicit(0, 0) == 1
@@ -80,7 +96,7 @@ class TestElicitationUtils:
 
   def test_integer_synchronous_stdin_elicitor(self, agh_course_selection_instance, monkeypatch, capfd):
     issie1 = IntegerSynchronousStdInElicitor(preflib_instance=agh_course_selection_instance)
-    monkeypatch.setattr("builtins.input", lambda: 1)
+    monkeypatch.setattr("builtins.input", _always_one)
     assert issie1.elicit(0, 0) == 1
     assert issie1.elicit(0, 1) == 1
     assert issie1.elicit(0, 0) == 1
@@ -88,7 +104,7 @@ class TestElicitationUtils:
     out1, _ = capfd.readouterr()
     assert out1 == "Agent 1, what is your preference for alternative Course 1?\nAgent 1, what is your preference for alternative Course 2?\n"
     issie2 = IntegerSynchronousStdInElicitor(preflib_instance=agh_course_selection_instance)
-    monkeypatch.setattr("builtins.input", lambda: 0.1)
+    monkeypatch.setattr("builtins.input", _always_point_one)
     with pytest.raises(ValueError):
       issie2.elicit(0, 0)
 
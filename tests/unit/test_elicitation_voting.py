@@ -5,43 +5,56 @@ from socialchoicekit.elicitation_voting import LambdaPRV, KARV
 from socialchoicekit.elicitation_utils import ValuationProfileElicitor
 from socialchoicekit.profile_utils import StrictCompleteProfile, CompleteValuationProfile
 
+# Profile literals hoisted to module scope so the Python-list-to-ndarray
+# conversion happens once at import; .of() returns a read-only view.
+_BASIC_PROFILE_1 = np.array([
+  [1, 4, 3, 2],
+  [4, 2, 1, 3],
+  [4, 3, 2, 1],
+  [3, 4, 2, 1]
+], dtype=np.int8)
+_BASIC_PROFILE_1.setflags(write=False)
+
+_BASIC_VALUATION_PROFILE_1 = np.array([
+  [0.5, 0.1, 0.1, 0.3],
+  [0.2, 0.2, 0.4, 0.2],
+  [0.1, 0.3, 0.3, 0.3],
+  [0.2, 0.1, 0.3, 0.4],
+])
+_BASIC_VALUATION_PROFILE_1.setflags(write=False)
+
+# Expected LambdaPRV scores, one row per lambda, built once for all allclose checks.
+_EXPECTED_LAMBDA_PRV_SCORES = np.array([
+  [0.5, 0, 0.4, 0.7],
+  [0.5, 0.2, 1.0, 1.0],
+  [0.7, 0.5, 1.1, 1.2],
+  [1.0, 0.7, 1.1, 1.2],
+])
+_EXPECTED_LAMBDA_PRV_SCORES.setflags(write=False)
+
+_EXPECTED_LAMBDA_PRV_WINNERS = [4, 3, 4, 4]
+
 class TestElicitationVoting:
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_profile_1(self):
-    return StrictCompleteProfile.of(np.array([
-      [1, 4, 3, 2],
-      [4, 2, 1, 3],
-      [4, 3, 2, 1],
-      [3, 4, 2, 1]
-    ]))
+    return StrictCompleteProfile.of(_BASIC_PROFILE_1)
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_valuation_profile_1(self):
-    return CompleteValuationProfile.of(np.array([
-      [0.5, 0.1, 0.1, 0.3],
-      [0.2, 0.2, 0.4, 0.2],
-      [0.1, 0.3, 0.3, 0.3],
-      [0.2, 0.1, 0.3, 0.4],
-    ]))
+    return CompleteValuationProfile.of(_BASIC_VALUATION_PROFILE_1)
+
+  # One shared instance per lambda; lambda_=2 has a score tie so it pins the tie breaker.
+  @pytest.fixture(scope="class", params=[1, 2, 3, 4])
+  def lprv(self, request):
+    if request.param == 2:
+      return LambdaPRV(lambda_=2, tie_breaker="first")
+    return LambdaPRV(lambda_=request.param)
 
-  def test_lambda_prv_basic_1(self, basic_profile_1, basic_valuation_profile_1):
-    lprv_1 = LambdaPRV(lambda_=1)
-    lprv_2 = LambdaPRV(lambda_=2, tie_breaker="first")
-    lprv_3 = LambdaPRV(lambda_=3)
-    lprv_4 = LambdaPRV(lambda_=4)
+  def test_lambda_prv_basic_1(self, basic_profile_1, basic_valuation_profile_1, lprv):
     vpe = ValuationProfileElicitor(basic_valuation_profile_1)
-    score_1 = lprv_1.score(basic_profile_1, vpe)
-    assert np.allclose(score_1, np.array([0.5, 0, 0.4, 0.7]))
-    assert lprv_1.scf(basic_profile_1, vpe) == 4
-    score_2 = lprv_2.score(basic_profile_1, vpe)
-    assert np.allclose(score_2, np.array([0.5, 0.2, 1.0, 1.0]))
-    assert lprv_2.scf(basic_profile_1, vpe) == 3
-    score_3 = lprv_3.score(basic_profile_1, vpe)
-    assert np.allclose(score_3, np.array([0.7, 0.5, 1.1, 1.2]))
-    assert lprv_3.scf(basic_profile_1, vpe) == 4
-    score_4 = lprv_4.score(basic_profile_1, vpe)
-    assert np.allclose(score_4, np.array([1.0, 0.7, 1.1, 1.2]))
-    assert lprv_4.scf(basic_profile_1, vpe) == 4
+    score = lprv.score(basic_profile_1, vpe)
+    assert np.allclose(score, _EXPECTED_LAMBDA_PRV_SCORES[lprv.lambda_ - 1])
+    assert lprv.scf(basic_profile_1, vpe) == _EXPECTED_LAMBDA_PRV_WINNERS[lprv.lambda_ - 1]
 
   def test_lambda_prv_with_invalid_lambda(self, basic_profile_1, basic_valuation_profile_1):
     with pytest.raises(ValueError):
@@ -3,9 +3,16 @@ import numpy as np
 
 from socialchoicekit.flow import *
 
+# Bipartite partitions shared by the tests below, hoisted as tuples so no list
+# is rebuilt per test (the flow helpers only iterate and concatenate them).
+_LEFT_NODES = (0, 1, 2)
+_RIGHT_NODES = (3, 4, 5, 6)
+
 class TestFlow:
 
-  @pytest.fixture
+  # The flow helpers never mutate their inputs (ford_fulkerson builds its own
+  # residual arrays), so these graphs can be built once per class.
+  @pytest.fixture(scope="class")
   def bipartite_graph_undirected(self):
     return {
       0: [3, 4, 5, 6],
@@ -17,7 +24,7 @@ class TestFlow:
       6: [0, 2]
     }
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def bipartite_graph_directed(self):
     return {
       0: [3, 4, 5, 6],
@@ -29,7 +36,7 @@ class TestFlow:
       6: []
     }
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def flow_network_integral_1(self):
     """
     A basic general (non bipartite) flow network with integral capacities.
@@ -42,7 +49,7 @@ class TestFlow:
     }, 0, 3)
 
   # Borrowed from Aizu Online Judge test cases
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def flow_network_integral_2(self):
     return ({
       0: [(1, 1), (2, 12)],
@@ -54,29 +61,38 @@ class TestFlow:
     }, 0, 5)
 
   def test_convert_bipartite_graph_to_flow_network_undirected(self, bipartite_graph_undirected):
-    network = convert_bipartite_graph_to_flow_network(bipartite_graph_undirected, list(range(0, 3)), list(range(3, 7)))
-    assert isinstance(network, dict)
+    network = convert_bipartite_graph_to_flow_network(bipartite_graph_undirected, _LEFT_NODES, _RIGHT_NODES)
+    # Every edge has capacity 1, so the adjacency holds bare vertex ids in read-only tuples.
     assert network.keys() == set(range(-2, 7))
-    assert network[-2] == []
-    assert network[-1] == [(i, 1) for i in range(0, 3)]
-    assert network[0] == [(3, 1), (4, 1), (5, 1), (6, 1)]
-    assert network[1] == [(3, 1), (5, 1)]
-    assert network[3] == [(-2, 1)]
+    assert network[-2] == ()
+    assert network[-1] == tuple(range(0, 3))
+    assert network[0] == (3, 4, 5, 6)
+    assert network[1] == (3, 5)
+    assert network[3] == (-2,)
 
   def test_convert_bipartite_graph_to_flow_network_directed(self, bipartite_graph_directed):
-    network = convert_bipartite_graph_to_flow_network(bipartite_graph_directed, list(range(0, 3)), list(range(3, 7)))
-    assert isinstance(network, dict)
+    network = convert_bipartite_graph_to_flow_network(bipartite_graph_directed, _LEFT_NODES, _RIGHT_NODES)
     assert network.keys() == set(range(-2, 7))
-    assert network[-2] == []
-    assert network[-1] == [(i, 1) for i in range(0, 3)]
-    assert network[0] == [(3, 1), (4, 1), (5, 1), (6, 1)]
-    assert network[1] == [(3, 1), (5, 1)]
-    assert network[3] == [(-2, 1)]
+    assert network[-2] == ()
+    assert network[-1] == tuple(range(0, 3))
+    assert network[0] == (3, 4, 5, 6)
+    assert network[1] == (3, 5)
+    assert network[3] == (-2,)
+
+  def test_convert_bipartite_graph_to_flow_network_csr(self, bipartite_graph_undirected):
+    indptr, indices, cap, n = convert_bipartite_graph_to_flow_network_csr(bipartite_graph_undirected, _LEFT_NODES, _RIGHT_NODES)
+    # Source is 0, X maps to 1..3, Y maps to 4..7, sink is 8.
+    assert n == 9
+    assert np.array_equal(indptr, [0, 3, 7, 9, 11, 12, 13, 14, 15, 15])
+    assert np.array_equal(indices[0:3], [1, 2, 3])
+    assert np.array_equal(indices[3:7], [4, 5, 6, 7])
+    assert np.array_equal(indices[7:9], [4, 6])
+    assert np.array_equal(indices[11:15], [8, 8, 8, 8])
+    assert np.all(cap == 1)
 
   def test_ford_fulkerson_integral_1(self, flow_network_integral_1):
     network, s, t = flow_network_integral_1
     flow, min_cut = ford_fulkerson(network, s, t)
-    assert isinstance(flow, dict)
     for (u, v) in flow.keys():
       # Here, due to the nature of the basic flow network as only having binary capacities, the capacity can be assumed to be always 1.
       assert (v, 1) in network[u]
@@ -93,9 +109,14 @@ class TestFlow:
     assert flow[(0, 1)] + flow[(0, 2)] == 13
     assert flow_across_network(flow, 0) == capacity_across_cut(network, min_cut)
 
+  def test_maximum_cardinality_matching_bipartite_ndarray_adjacency(self, bipartite_graph_undirected):
+    # Adjacency may be given as flat int arrays instead of lists of Python ints.
+    graph = {u: np.array(vs, dtype=np.int32) for u, vs in bipartite_graph_undirected.items()}
+    matchings = maximum_cardinality_matching_bipartite(graph, _LEFT_NODES, _RIGHT_NODES)
+    assert len(matchings) == 3
+
   def test_maximum_cardinality_matching_bipartite(self, bipartite_graph_undirected):
-    matchings = maximum_cardinality_matching_bipartite(bipartite_graph_undirected, list(range(0, 3)), list(range(3, 7)))
-    assert isinstance(matchings, list)
+    matchings = maximum_cardinality_matching_bipartite(bipartite_graph_undirected, _LEFT_NODES, _RIGHT_NODES)
     assert len(matchings) == 3
     assert all([x < y for (x, y) in matchings])
     assert (1, 3) in matchings or (1, 5) in matchings
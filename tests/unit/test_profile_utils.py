@@ -3,47 +3,87 @@ import pytest
 
 from socialchoicekit.profile_utils import *
 
+# Profile literals hoisted to module scope so the Python-list-to-ndarray
+# conversion happens once at import; .of() returns a read-only view.
+_STRICT_INCOMPLETE_PROFILE_1 = np.array([
+  [1, np.nan, 2, 3, np.nan],
+  [3, 4, np.nan, 1, 2],
+  [1, 5, 4, 3, 2],
+  [np.nan, np.nan, np.nan, np.nan, 1],
+  [4, 2, 3, 1, np.nan]
+])
+_STRICT_INCOMPLETE_PROFILE_1.setflags(write=False)
+
+_STRICT_COMPLETE_PROFILE_1 = np.array([
+  [1, 4, 2, 3, 5],
+  [3, 4, 5, 1, 2],
+  [1, 5, 4, 3, 2],
+  [2, 3, 4, 5, 1],
+  [4, 2, 3, 1, 5],
+])
+_STRICT_COMPLETE_PROFILE_1.setflags(write=False)
+
+_COMPLETE_PROFILE_WITH_TIES_1 = np.array([
+  [1, 4, 2, 3, 4],
+  [3, 4, 5, 1, 2],
+  [1, 5, 4, 3, 2],
+  [2, 2, 2, 2, 1],
+  [4, 2, 3, 1, 5],
+])
+_COMPLETE_PROFILE_WITH_TIES_1.setflags(write=False)
+
+# Completing this profile will NOT result in complete_profile_with_ties_1
+_INCOMPLETE_PROFILE_WITH_TIES_1 = np.array([
+  [1, np.nan, 2, 2, np.nan],
+  [3, 4, np.nan, 1, 1],
+  [1, 5, 4, 3, 2],
+  [np.nan, np.nan, np.nan, np.nan, 1],
+  [4, 2, 3, 1, np.nan],
+])
+_INCOMPLETE_PROFILE_WITH_TIES_1.setflags(write=False)
+
+_ORDINAL_PROFILE_2 = np.array([
+  [1, 5, 2, 3, 4],
+  [4, 5, 3, 1, 2],
+  [1, np.nan, 4, 2, 3]
+])
+_ORDINAL_PROFILE_2.setflags(write=False)
+
+_CARDINAL_PROFILE_2 = np.array([
+  [0.9, 0, 0.05, 0.04, 0.01],
+  [0.1, 0.05, 0.15, 0.4, 0.3],
+  [0.7, np.nan, 0.01, 0.2, 0.09]
+])
+_CARDINAL_PROFILE_2.setflags(write=False)
+
+_ORDINAL_PROFILE_3 = np.array([
+  [1, 3, 2],
+  [1, 3, 2],
+])
+_ORDINAL_PROFILE_3.setflags(write=False)
+
+_CARDINAL_PROFILE_3 = np.array([
+  [0.5, 0.25, 0.25],
+  [0.4, 0.3, 0.4],
+])
+_CARDINAL_PROFILE_3.setflags(write=False)
+
 class TestProfileUtils:
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def strict_incomplete_profile_1(self):
-    return StrictIncompleteProfile.of(np.array([
-      [1, np.nan, 2, 3, np.nan],
-      [3, 4, np.nan, 1, 2],
-      [1, 5, 4, 3, 2],
-      [np.nan, np.nan, np.nan, np.nan, 1],
-      [4, 2, 3, 1, np.nan]
-    ]))
-
-  @pytest.fixture
+    return StrictIncompleteProfile.of(_STRICT_INCOMPLETE_PROFILE_1)
+
+  @pytest.fixture(scope="class")
   def strict_complete_profile_1(self):
-    return StrictCompleteProfile.of(np.array([
-      [1, 4, 2, 3, 5],
-      [3, 4, 5, 1, 2],
-      [1, 5, 4, 3, 2],
-      [2, 3, 4, 5, 1],
-      [4, 2, 3, 1, 5],
-    ]))
-
-  @pytest.fixture
+    return StrictCompleteProfile.of(_STRICT_COMPLETE_PROFILE_1)
+
+  @pytest.fixture(scope="class")
   def complete_profile_with_ties_1(self):
-    return CompleteProfileWithTies.of(np.array([
-      [1, 4, 2, 3, 4],
-      [3, 4, 5, 1, 2],
-      [1, 5, 4, 3, 2],
-      [2, 2, 2, 2, 1],
-      [4, 2, 3, 1, 5],
-    ]))
-
-  @pytest.fixture
+    return CompleteProfileWithTies.of(_COMPLETE_PROFILE_WITH_TIES_1)
+
+  @pytest.fixture(scope="class")
   def incomplete_profile_with_ties_1(self):
-    # Completing this profile will NOT result in complete_profile_with_ties_1
-    return IncompleteProfileWithTies.of(np.array([
-      [1, np.nan, 2, 2, np.nan],
-      [3, 4, np.nan, 1, 1],
-      [1, 5, 4, 3, 2],
-      [np.nan, np.nan, np.nan, np.nan, 1],
-      [4, 2, 3, 1, np.nan],
-    ]))
+    return IncompleteProfileWithTies.of(_INCOMPLETE_PROFILE_WITH_TIES_1)
 
   def test_incomplete_profile_to_complete_profile_1(
     self,
@@ -53,17 +93,17 @@ class TestProfileUtils:
     complete_profile_with_ties_1,
   ):
     completed_profile_first = incomplete_profile_to_complete_profile(strict_incomplete_profile_1, tie_breaker="first")
-    assert np.all(completed_profile_first == strict_complete_profile_1)
+    assert np.array_equal(completed_profile_first, strict_complete_profile_1)
     assert isinstance(completed_profile_first, StrictCompleteProfile)
     completed_profile_accept = incomplete_profile_to_complete_profile(strict_incomplete_profile_1, tie_breaker="accept")
-    assert np.all(completed_profile_accept == complete_profile_with_ties_1)
+    assert np.array_equal(completed_profile_accept, complete_profile_with_ties_1)
     assert isinstance(completed_profile_accept, CompleteProfileWithTies)
 
     completed_profile_random = incomplete_profile_to_complete_profile(incomplete_profile_with_ties_1, tie_breaker="random")
     assert np.amax(completed_profile_random[0, :]) == 5
     assert np.all(completed_profile_random[0, :] != 3)
     assert np.all(completed_profile_random[1, :] != 2)
-    assert np.all(completed_profile_random[4] == np.array([4, 2, 3, 1, 5]))
+    assert np.array_equal(completed_profile_random[4], [4, 2, 3, 1, 5])
     assert isinstance(completed_profile_random, CompleteProfileWithTies)
 
   def test_profile_with_ties_to_strict_profile_1(
@@ -74,7 +114,7 @@ class TestProfileUtils:
     strict_incomplete_profile_1,
   ):
     strict_complete_profile_first = profile_with_ties_to_strict_profile(complete_profile_with_ties_1, tie_breaker="first")
-    assert np.all(strict_complete_profile_first == strict_complete_profile_1)
+    assert np.array_equal(strict_complete_profile_first, strict_complete_profile_1)
     assert isinstance(strict_complete_profile_first, StrictCompleteProfile)
 
     strict_incomeplete_profile_first = profile_with_ties_to_strict_profile(incomplete_profile_with_ties_1, tie_breaker="first")
@@ -84,21 +124,13 @@ class TestProfileUtils:
     strict_complete_profile_random = profile_with_ties_to_strict_profile(complete_profile_with_ties_1, tie_breaker="random")
     assert np.sum(strict_complete_profile_random) == np.sum(strict_complete_profile_1)
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def ordinal_profile_2(self):
-    return StrictIncompleteProfile.of(np.array([
-      [1, 5, 2, 3, 4],
-      [4, 5, 3, 1, 2],
-      [1, np.nan, 4, 2, 3]
-    ]))
+    return StrictIncompleteProfile.of(_ORDINAL_PROFILE_2)
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def cardinal_profile_2(self):
-    return IncompleteValuationProfile.of(np.array([
-      [0.9, 0, 0.05, 0.04, 0.01],
-      [0.1, 0.05, 0.15, 0.4, 0.3],
-      [0.7, np.nan, 0.01, 0.2, 0.09]
-    ]))
+    return IncompleteValuationProfile.of(_CARDINAL_PROFILE_2)
 
   def test_compute_ordinal_profile_2(self, cardinal_profile_2, ordinal_profile_2):
     ordinal_profile = compute_ordinal_profile(cardinal_profile_2)
@@ -110,19 +142,13 @@ class TestProfileUtils:
     assert is_consistent_valuation_profile(cardinal_profile_2, ordinal_profile_2)
     assert is_consistent_valuation_profile(cardinal_profile_2[1:] + cardinal_profile_2[:1], ordinal_profile_2) == False
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def ordinal_profile_3(self):
-    return StrictCompleteProfile.of(np.array([
-      [1, 3, 2],
-      [1, 3, 2],
-    ]))
+    return StrictCompleteProfile.of(_ORDINAL_PROFILE_3)
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def cardinal_profile_3(self):
-    return CompleteValuationProfile.of(np.array([
-      [0.5, 0.25, 0.25],
-      [0.4, 0.3, 0.4],
-    ]))
+    return CompleteValuationProfile.of(_CARDINAL_PROFILE_3)
 
   def test_is_consistent_valuation_profile_3(self, cardinal_profile_3, ordinal_profile_3):
     assert is_consistent_valuation_profile(cardinal_profile_3, ordinal_profile_3)
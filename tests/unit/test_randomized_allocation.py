@@ -4,63 +4,94 @@ import numpy as np
 from socialchoicekit.randomized_allocation import RandomSerialDictatorship, ProbabilisticSerial, SimultaneousEating
 from socialchoicekit.profile_utils import StrictIncompleteProfile
 
+# Expected allocations and profile literals shared across tests, built once per
+# module and frozen so no test can mutate them; .of() returns a read-only view.
+EXPECTED_RSD_ALLOCATION = np.array([1, 2, 4])
+EXPECTED_RSD_ALLOCATION.setflags(write=False)
+ITEMS_1_TO_4 = np.array([1, 2, 3, 4])
+ITEMS_1_TO_4.setflags(write=False)
+
+_BASIC_PROFILE_1 = np.array([
+  [1, 2, 3, 4],
+  [2, 1, np.nan, np.nan],
+  [3, np.nan, 2, 1],
+])
+_BASIC_PROFILE_1.setflags(write=False)
+
+_BASIC_PROFILE_2 = np.array([
+  [1, 2, 3, 4],
+  [2, 1, np.nan, np.nan],
+  [3, np.nan, 2, 1],
+  [np.nan, np.nan, np.nan, np.nan],
+])
+_BASIC_PROFILE_2.setflags(write=False)
+
+_BASIC_PROFILE_3 = np.array([
+  [1.0, 2.0, 3.0, 4.0],
+  [1, 2, 3, np.nan],
+  [3, np.nan, 2, 1],
+  [2, 1, 3, np.nan],
+])
+_BASIC_PROFILE_3.setflags(write=False)
+
+_SPEEDS_3 = np.array([1, 1, 2, 2])
+_SPEEDS_3.setflags(write=False)
+
 class TestRandomizedAllocation:
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_profile_1(self):
-    return StrictIncompleteProfile.of(np.array([
-      [1, 2, 3, 4],
-      [2, 1, np.nan, np.nan],
-      [3, np.nan, 2, 1],
-    ]))
+    return StrictIncompleteProfile.of(_BASIC_PROFILE_1)
 
   def test_random_serial_dictatorship_basic_1(self, basic_profile_1):
     rsd = RandomSerialDictatorship()
     allocation = rsd.scf(basic_profile_1)
-    assert np.all(allocation == np.array([1, 2, 4]))
+    assert np.array_equal(allocation, EXPECTED_RSD_ALLOCATION)
+
+  def test_random_serial_dictatorship_batch_1(self, basic_profile_1):
+    rsd = RandomSerialDictatorship()
+    allocations = rsd.scf_batch(basic_profile_1, 10)
+    assert allocations.shape == (10, 3)
+    assert np.all(allocations == EXPECTED_RSD_ALLOCATION)
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_profile_2(self):
-    return StrictIncompleteProfile.of(np.array([
-      [1, 2, 3, 4],
-      [2, 1, np.nan, np.nan],
-      [3, np.nan, 2, 1],
-      [np.nan, np.nan, np.nan, np.nan],
-    ]))
+    return StrictIncompleteProfile.of(_BASIC_PROFILE_2)
 
   def test_random_serial_dictatorship_basic_2(self, basic_profile_2):
     rsd = RandomSerialDictatorship()
     allocation = rsd.scf(basic_profile_2)
-    assert np.all(allocation[0:3] == np.array([1, 2, 4])) and np.isnan(allocation[3])
+    assert np.array_equal(allocation[0:3], EXPECTED_RSD_ALLOCATION) and np.isnan(allocation[3])
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def basic_profile_3(self):
-    return StrictIncompleteProfile.of(np.array([
-      [1.0, 2.0, 3.0, 4.0],
-      [1, 2, 3, np.nan],
-      [3, np.nan, 2, 1],
-      [2, 1, 3, np.nan],
-    ]))
+    return StrictIncompleteProfile.of(_BASIC_PROFILE_3)
 
   def test_probabilistic_serial_3(self, basic_profile_3):
     ps = ProbabilisticSerial()
     bistochastic = ps.bistochastic(basic_profile_3)
-    assert np.all(bistochastic == np.array([
+    assert np.array_equal(bistochastic, [
       [1/2, 1/6, 1/3, 0],
       [1/2, 1/6, 1/3, 0],
       [0, 0, 0, 1],
       [0, 2/3, 1/3, 0],
-    ]))
+    ])
 
-  @pytest.fixture
+  @pytest.fixture(scope="class")
   def speeds_3(self):
-    return np.array([1, 1, 2, 2])
+    return _SPEEDS_3
 
   def test_simultaneous_eating_3(self, basic_profile_3, speeds_3):
     se = SimultaneousEating()
     bistochastic = se.bistochastic(basic_profile_3, speeds_3)
-    assert np.all(bistochastic == np.array([
+    assert np.array_equal(bistochastic, [
       [1/2, 0, 1/2, 0],
       [1/2, 0, 1/2, 0],
       [0, 0, 0, 1],
       [0, 1, 0, 0],
-    ]))
+    ])
+
+  def test_simultaneous_eating_scf_3(self, basic_profile_3, speeds_3):
+    se = SimultaneousEating(seed=0)
+    allocation = se.scf(basic_profile_3, speeds_3)
+    # The sampled permutation must allocate every item exactly once.
+    assert np.array_equal(np.sort(allocation), ITEMS_1_TO_4)